@@ -1,23 +1,431 @@
-import sys
 import os
+import sys
+import shutil
+import contextlib
 import re
+import time
+import functools
+import mimetypes
+import mmap
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QSplitter, QTextEdit, QFileDialog, QMessageBox, QMenuBar, QListWidget,
-    QToolBar, QToolButton, QMenu, QDialog, QVBoxLayout, QLineEdit, QListWidgetItem, QLabel, QPushButton, QHBoxLayout
+    QApplication, QMainWindow, QSplitter, QPlainTextEdit, QFileDialog, QMessageBox, QMenuBar, QListWidget,
+    QToolBar, QToolButton, QMenu, QDialog, QVBoxLayout, QLineEdit, QListWidgetItem, QLabel, QPushButton,
+    QListView, QAbstractItemView, QScrollArea
 )
-from PyQt6.QtGui import QAction, QTextCursor, QKeyEvent, QFontDatabase, QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QIcon
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-import markdown2
+from PyQt6.QtGui import QAction, QCursor, QDesktopServices, QTextCursor, QKeyEvent, QFontDatabase, QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QIcon
+from PyQt6.QtCore import Qt, QUrl, QBuffer, QByteArray, QTimer, QFile, QIODevice, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QStringListModel, QSortFilterProxyModel
+try:
+    import re2 as highlight_re  # google-re2: linear-time matching behind the same API as re
+except ImportError:
+    highlight_re = re
 
 # Paths for resources
 BASE_DIR = Path(__file__).resolve().parent.parent
 RESOURCES_DIR = BASE_DIR / 'resources'
 FONTS_DIR = RESOURCES_DIR / 'TTF'
 ICONS_DIR = RESOURCES_DIR / 'icons'
+JS_DIR = RESOURCES_DIR / 'js'
+# Preview libraries: bundled copies under resources/js win over the CDN when present
+MATHJAX_LOCAL = JS_DIR / 'mathjax' / 'tex-mml-chtml.js'
+MATHJAX_CDN = 'https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'
+MERMAID_LOCAL = JS_DIR / 'mermaid.min.js'
+MERMAID_CDN = 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js'
+# The preview page lives under its own URL scheme, served from resources/ only (no file:// access)
+PREVIEW_SCHEME = b'simplemd'
+PREVIEW_BASE_URL = 'simplemd://preview/'
+# Save/export dialog filters -> extension given to a file name typed without one
+_SAVE_FILTER_EXT = {
+    "Markdown Files (*.md)": '.md',
+    "MDX Files (*.mdx)": '.mdx',
+    "All Files (*)": '.md',
+}
+_SAVE_FILTERS = ';;'.join(_SAVE_FILTER_EXT)
+
+@functools.lru_cache(maxsize=None)
+def _markdown_renderer():
+    """Import the Markdown engine on first use: cmark-gfm (C), then mistune, then markdown2.
+
+    Returns (engine name, render function); the name lets block rendering follow engine quirks.
+    """
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options as CmarkOptions
+    except ImportError:
+        pass
+    else:
+        extensions = ['table', 'strikethrough', 'tasklist', 'autolink']
+        def render(text):
+            # UNSAFE keeps raw HTML (MDX comments, inline tags) instead of escaping it
+            return cmarkgfm.markdown_to_html_with_extensions(
+                text, options=CmarkOptions.CMARK_OPT_UNSAFE, extensions=extensions
+            )
+        return 'cmark', render
+    try:
+        import mistune
+    except ImportError:
+        import markdown2
+        # Reuse one Markdown per thread (exports render on the pool); convert() resets its state
+        local = threading.local()
+        def render(text):
+            md = getattr(local, 'md', None)
+            if md is None:
+                # Fenced blocks with class="language-x", as cmark and mistune emit (```mermaid included)
+                md = local.md = markdown2.Markdown(extras=['fenced-code-blocks', 'highlightjs-lang'])
+            return md.convert(text)
+        return 'markdown2', render
+    # escape=False keeps raw HTML (MDX comments, inline tags), matching cmark's UNSAFE option;
+    # ```mermaid fences come out as language-mermaid code blocks, like the other engines
+    return 'mistune', mistune.create_markdown(
+        escape=False, plugins=['strikethrough', 'table', 'task_lists', 'footnotes', 'url']
+    )
+
+def _markdown_to_html(text):
+    return _markdown_renderer()[1](text)
+
+# MDX detection: top-level import/export statements and capitalised JSX component tags
+_MDX_IMPORT_RE = re.compile(r'^\s*(import|export)\s', re.MULTILINE)
+_MDX_TAG_RE = re.compile(r'^\s*<\s*[A-Z][A-Za-z0-9_.-]*\b', re.MULTILINE)
+_JSX_COMMENT_RE = re.compile(r'\{/\*([\s\S]*?)\*/\}')
+_JSX_NAME_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-')
+
+# Tag tests for the MDX scanner. Each takes a line already lstrip()ped of leading whitespace
+# and mirrors the regex noted in its docstring using str methods only.
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+def _jsx_open_tag(stripped):
+    r"""Component name in ^<\s*([A-Z][A-Za-z0-9_.-]*)\b, or None."""
+    rest = stripped[1:].lstrip()
+    if not rest or not 'A' <= rest[0] <= 'Z':
+        return None
+    end = 1
+    while end < len(rest) and rest[end] in _JSX_NAME_CHARS:
+        end += 1
+    # Back off to a word boundary, as the regex's \b does by backtracking
+    while end and _is_word_char(rest[end - 1]) == (end < len(rest) and _is_word_char(rest[end])):
+        end -= 1
+    return rest[:end] or None
+
+def _is_self_closed(stripped):
+    r"""/\s*>\s*$"""
+    tail = stripped.rstrip()
+    return tail.endswith('>') and tail[:-1].rstrip().endswith('/')
+
+def _ends_with_close_tag(stripped, tag):
+    r"""</\s*tag\s*>\s*$"""
+    tail = stripped.rstrip()
+    if not tail.endswith('>'):
+        return False
+    tail = tail[:-1].rstrip()
+    return tail.endswith(tag) and tail[:len(tail) - len(tag)].rstrip().endswith('</')
+
+def _is_close_tag_line(stripped, tag):
+    r"""^</\s*tag\s*>\s*$"""
+    tail = stripped.rstrip()
+    return tail.startswith('</') and tail.endswith('>') and tail[2:-1].strip() == tag
+
+_MMAP_READ_THRESHOLD = 4 * 1024 * 1024  # bytes
+_WRITE_CHUNK_CHARS = 1024 * 1024
+
+def _read_text(path):
+    """Read a UTF-8 file with universal newlines; large files decode straight from a memory map."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_READ_THRESHOLD:
+            # No intermediate bytes copy of the whole file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8')
+        else:
+            text = f.read().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _write_text(path, text):
+    """Write text as UTF-8, a slice at a time so no full-size bytes copy is built.
+
+    The text goes to a temporary file beside the target, which then replaces it in one step,
+    so a failed or interrupted save never leaves a truncated or half-old file behind.
+    """
+    path = os.path.realpath(path)  # Replace a symlink's target, not the link
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        # Text mode keeps the platform newline translation (CRLF on Windows) that saves always had
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for start in range(0, len(text), _WRITE_CHUNK_CHARS):
+                f.write(text[start:start + _WRITE_CHUNK_CHARS])
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+def _register_preview_scheme():
+    """Declare PREVIEW_SCHEME to QtWebEngine; this has to happen before the QApplication exists."""
+    from PyQt6.QtWebEngineCore import QWebEngineUrlScheme
+    scheme = QWebEngineUrlScheme(PREVIEW_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    # Secure so https fonts/CDN scripts are not mixed content; not Local, so it gets no file:// access
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme | QWebEngineUrlScheme.Flag.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+def _preview_scheme_handler(parent):
+    """Handler answering PREVIEW_SCHEME requests with files under resources/ and nothing else."""
+    from PyQt6.QtWebEngineCore import QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+
+    class PreviewSchemeHandler(QWebEngineUrlSchemeHandler):
+        def requestStarted(self, job):
+            url = job.requestUrl()
+            data = None
+            if url.host() == 'preview':
+                data = _preview_resource(url.path())
+            if data is None:
+                job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+                return
+            mime, _ = mimetypes.guess_type(url.path())
+            buffer = QBuffer(job)  # Freed with the job
+            buffer.setData(data)
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            job.reply((mime or 'application/octet-stream').encode('ascii'), buffer)
+
+    return PreviewSchemeHandler(parent)
+
+def _preview_page(parent):
+    """Preview page that keeps the scaffold in place and hands followed links to the system browser."""
+    from PyQt6.QtWebEngineCore import QWebEnginePage
+
+    scaffold_url = QUrl(PREVIEW_BASE_URL)
+
+    class PreviewPage(QWebEnginePage):
+        def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+            if not is_main_frame:
+                return True
+            # Only the scaffold itself; anchors within it (footnotes) keep the page in place
+            is_scaffold = url.adjusted(QUrl.UrlFormattingOption.RemoveFragment) == scaffold_url
+            if nav_type != QWebEnginePage.NavigationType.NavigationTypeLinkClicked:
+                return is_scaffold or url.scheme() == 'data'  # setContent loads through data:
+            if is_scaffold:
+                return True
+            # Relative links resolve under the scheme, where nothing but resources/ is served
+            if url.scheme() != PREVIEW_SCHEME.decode('ascii'):
+                QDesktopServices.openUrl(url)
+            return False
+
+    return PreviewPage(parent)
+
+def _preview_resource(url_path):
+    """Bytes of resources/<url_path>, or None for anything missing or outside resources/."""
+    root = RESOURCES_DIR.resolve()
+    target = (root / url_path.lstrip('/')).resolve()
+    if root not in target.parents or not target.is_file():
+        return None
+    return target.read_bytes()
+
+def _register_fonts(font_dir):
+    # QFontDatabase is thread-safe in Qt 6, so this can run off the GUI thread
+    if font_dir.exists():
+        for font_file in font_dir.glob('*.ttf'):
+            QFontDatabase.addApplicationFont(str(font_file))
+
+class _IOSignals(QObject):
+    done = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class _IOTask(QRunnable):
+    """Run a blocking callable on the thread pool and report back through queued signals."""
+    def __init__(self, fn, *args, owner=None):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        # Owned by the window, which outlives the task (its pool waits for running tasks)
+        self.signals = _IOSignals(owner)
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+class _PreviewBridge(QObject):
+    """Python end of the preview's QWebChannel; the injected bridge script applies contentPatched splices."""
+    contentPatched = pyqtSignal(int, int, str)  # prefix length, suffix length (UTF-16 units), new middle
+    pageReady = pyqtSignal()
+
+    @pyqtSlot()
+    def ready(self):
+        self.pageReady.emit()
+
+# Characters outside the BMP, which take two UTF-16 code units (JavaScript string indexes)
+_ASTRAL_RE = re.compile('[\U00010000-\U0010ffff]')
+
+def _utf16_len(text, start, end):
+    """UTF-16 length of text[start:end], counted in place rather than by encoding a copy."""
+    if text.isascii():
+        return end - start
+    return end - start + len(_ASTRAL_RE.findall(text, start, end))
+
+def _utf16_to_index(text, units):
+    """Index into text of a Qt position, which counts UTF-16 code units (two per astral character)."""
+    if text.isascii():
+        return units
+    index = 0
+    while units > 0 and index < len(text):
+        units -= 2 if ord(text[index]) > 0xFFFF else 1
+        index += 1
+    return index
+
+# The diff scans compare fixed-size chunks, so each character before the first difference is
+# copied once, then binary search only within the chunk that differs
+_DIFF_CHUNK = 8192
+
+def _common_prefix_len(a, b):
+    limit = min(len(a), len(b))
+    length = 0
+    while length < limit:
+        step = min(_DIFF_CHUNK, limit - length)
+        if a[length:length + step] != b[length:length + step]:
+            break
+        length += step
+    else:
+        return length
+    lo, hi = length, length + step - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[length:mid] == b[length:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _common_suffix_len(a, b, limit):
+    end_a, end_b = len(a), len(b)
+    length = 0
+    while length < limit:
+        step = min(_DIFF_CHUNK, limit - length)
+        if a[end_a - length - step:end_a - length] != b[end_b - length - step:end_b - length]:
+            break
+        length += step
+    else:
+        return length
+    lo, hi = length, length + step - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[end_a - mid:end_a - length] == b[end_b - mid:end_b - length]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+@functools.lru_cache(maxsize=8)
+def _render_md_cached(text):
+    """Render preview Markdown to HTML; repeated text (undo/redo round-trips) is a cache hit."""
+    return _markdown_to_html(text)
+
+@functools.lru_cache(maxsize=1)
+def _render_export_md(text):
+    """Render export Markdown; HTML then PDF of one buffer renders once."""
+    return _markdown_to_html(text)
+
+# Constructs that can reach across blank lines: link/footnote definitions and raw HTML
+_WHOLE_DOC_MARKERS = (']:', '<!--', '<pre', '<script', '<style', '<textarea')
+_LIST_MARKER_RE = re.compile(r'(?:[-+*]|\d+[.)])(?:\s|$)')
+
+def _split_md_blocks(text, engine):
+    """Split Markdown at blank lines that close every open construct, so blocks render independently.
+
+    Fenced code is never split, and neither is a blank line followed by an indented line or a
+    list marker, since either could continue the block before it. Returns None when the split
+    could change the output: a line of raw HTML outside fenced code (the engines disagree on
+    where HTML blocks end and whether they hide the fences after them), a fence left open at
+    the end, or, for mistune and markdown2, a blockquote continued by a line without ``>``,
+    which they let swallow or reorder the blocks after it.
+    """
+    blocks = []
+    current = []
+    has_content = False  # Leading blank lines stay with the first block instead of forming one
+    fence = None  # Run of ` or ~ that opened the current code fence
+    in_list = False  # Indented fences inside a list item close with the item, so they are ignored
+    after_blank = False
+    in_quote = False  # Last non-blank line was a blockquote line
+    for line in text.split('\n'):
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if fence is not None:
+            # A closing fence is a bare run of the same character, at least as long as the opener
+            closing = stripped.rstrip()
+            if indent < 4 and closing.startswith(fence) and not closing.strip(fence[0]):
+                fence = None
+        elif not stripped:
+            after_blank = has_content
+        else:
+            if in_quote and engine != 'cmark' and not stripped.startswith('>'):
+                # markdown2 also carries a blockquote over blank lines into indented code
+                if not after_blank or (indent and engine == 'markdown2'):
+                    return None
+            if after_blank and not indent and not _LIST_MARKER_RE.match(line):
+                blocks.append('\n'.join(current))
+                current = []
+                in_list = False
+            after_blank = False
+            has_content = True
+            in_quote = indent < 4 and stripped.startswith('>')
+            if indent < 4:
+                if stripped.startswith('<'):
+                    return None
+                if _LIST_MARKER_RE.match(stripped):
+                    in_list = True
+                elif not (indent and in_list) and stripped.startswith(('```', '~~~')):
+                    fence_len = len(stripped) - len(stripped.lstrip(stripped[0]))
+                    fence = stripped[:fence_len]
+        current.append(line)
+    if fence is not None:
+        return None
+    blocks.append('\n'.join(current))
+    return blocks
+
+def _render_md_blocks(text):
+    """Render preview Markdown block by block, so an edit only re-parses the blocks it touched."""
+    engine = _markdown_renderer()[0]
+    blocks = None
+    if not any(marker in text for marker in _WHOLE_DOC_MARKERS):
+        blocks = _split_md_blocks(text, engine)
+    if blocks is None:
+        return _render_md_cached(text)
+    # markdown2 puts a blank line between top-level blocks; their own output ends in one newline
+    separator = '\n' if engine == 'markdown2' else ''
+    return separator.join(map(_render_md_block, blocks))
+
+@functools.lru_cache(maxsize=2048)
+def _render_md_block(block):
+    return _markdown_to_html(block)
 
 class MarkdownHighlighter(QSyntaxHighlighter):
+    # Inline rules as (group name, pattern), fused into one alternation compiled once per process.
+    # re takes the leftmost match and, at the same position, the first alternative,
+    # so more specific rules come first (image/footnote before link, bold before italic).
+    _INLINE_RULES = (
+        ('code', r'`[^`]+`'),
+        ('image', r'!\[[^\]]*\]\([^\)]+\)'),
+        ('footnote', r'\[\^.+\]:.*'),
+        ('link', r'\[[^\]]+\]\([^\)]+\)'),
+        ('bold_star', r'\*\*[^\*]+\*\*'),
+        ('bold_under', r'__[^_]+__'),
+        ('italic_star', r'\*[^\*]+\*'),
+        ('italic_under', r'_[^_]+_'),
+        ('strike', r'~~[^~]+~~'),
+        ('task', r'- \[[ xX]\] '),
+        ('highlight', r'==[^=]+=='),
+    )
+    _INLINE_RE = highlight_re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _INLINE_RULES))
+    # Every inline rule needs one of these; plain prose lines skip the regex entirely
+    _INLINE_TRIGGERS = ('`', '[', '*', '_', '~', '=')
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Premium refined palette - softer, more readable colors
@@ -34,56 +442,81 @@ class MarkdownHighlighter(QSyntaxHighlighter):
         self.footnote = QColor('#e0af68')     # Warm amber
         self.taskbox = QColor('#7dcfff')      # Cyan
         self.highlight = QColor('#e0af68')    # Warm amber
-        self.rules = []
-        # Headings
-        fmt = QTextCharFormat(); fmt.setForeground(self.heading); fmt.setFontWeight(QFont.Weight.Bold)
-        self.rules.append((r'^(#{1,6})\s.*', fmt))
-        # Bold
-        fmt = QTextCharFormat(); fmt.setForeground(self.bold); fmt.setFontWeight(QFont.Weight.Bold)
-        self.rules.append((r'\*\*[^\*]+\*\*', fmt))
-        self.rules.append((r'__[^_]+__', fmt))
-        # Italic
-        fmt = QTextCharFormat(); fmt.setForeground(self.italic); fmt.setFontItalic(True)
-        self.rules.append((r'\*[^\*]+\*', fmt))
-        self.rules.append((r'_[^_]+_', fmt))
-        # Inline code
-        fmt = QTextCharFormat(); fmt.setForeground(self.code); fmt.setFontFamily('monospace')
-        self.rules.append((r'`[^`]+`', fmt))
-        # Blockquote
-        fmt = QTextCharFormat(); fmt.setForeground(self.blockquote)
-        self.rules.append((r'^>.*', fmt))
-        # List items
-        fmt = QTextCharFormat(); fmt.setForeground(self.listitem)
-        self.rules.append((r'^(\s*[-+*]|\s*\d+\.)\s', fmt))
-        # Link
-        fmt = QTextCharFormat(); fmt.setForeground(self.link); fmt.setFontUnderline(True)
-        self.rules.append((r'\[[^\]]+\]\([^\)]+\)', fmt))
-        # Image
-        fmt = QTextCharFormat(); fmt.setForeground(self.image)
-        self.rules.append((r'!\[[^\]]*\]\([^\)]+\)', fmt))
-        # Strikethrough
-        fmt = QTextCharFormat(); fmt.setForeground(self.strikethrough); fmt.setFontStrikeOut(True)
-        self.rules.append((r'~~[^~]+~~', fmt))
-        # Horizontal rule
-        fmt = QTextCharFormat(); fmt.setForeground(self.hr)
-        self.rules.append((r'^---+$', fmt))
-        # Footnote
-        fmt = QTextCharFormat(); fmt.setForeground(self.footnote)
-        self.rules.append((r'\[\^.+\]:.*', fmt))
-        # Task list
-        fmt = QTextCharFormat(); fmt.setForeground(self.taskbox)
-        self.rules.append((r'- \[[ xX]\] ', fmt))
-        # Highlight
-        fmt = QTextCharFormat(); fmt.setForeground(self.highlight)
-        self.rules.append((r'==[^=]+==', fmt))
+        # Line-prefix rules are dispatched by hand in highlightBlock
+        self.heading_fmt = QTextCharFormat(); self.heading_fmt.setForeground(self.heading); self.heading_fmt.setFontWeight(QFont.Weight.Bold)
+        self.blockquote_fmt = QTextCharFormat(); self.blockquote_fmt.setForeground(self.blockquote)
+        self.listitem_fmt = QTextCharFormat(); self.listitem_fmt.setForeground(self.listitem)
+        self.hr_fmt = QTextCharFormat(); self.hr_fmt.setForeground(self.hr)
+        # Line text -> ((start, length, fmt), ...); highlighting depends on nothing but the text,
+        # so repeated or unchanged lines hit wherever they sit, and the LRU bound caps its size
+        self._ranges_for = functools.lru_cache(maxsize=4096)(self._compute_ranges)
+        # Inline rule formats, keyed by _INLINE_RULES group name
+        bold_fmt = QTextCharFormat(); bold_fmt.setForeground(self.bold); bold_fmt.setFontWeight(QFont.Weight.Bold)
+        italic_fmt = QTextCharFormat(); italic_fmt.setForeground(self.italic); italic_fmt.setFontItalic(True)
+        code_fmt = QTextCharFormat(); code_fmt.setForeground(self.code); code_fmt.setFontFamily('monospace')
+        link_fmt = QTextCharFormat(); link_fmt.setForeground(self.link); link_fmt.setFontUnderline(True)
+        image_fmt = QTextCharFormat(); image_fmt.setForeground(self.image)
+        strike_fmt = QTextCharFormat(); strike_fmt.setForeground(self.strikethrough); strike_fmt.setFontStrikeOut(True)
+        footnote_fmt = QTextCharFormat(); footnote_fmt.setForeground(self.footnote)
+        task_fmt = QTextCharFormat(); task_fmt.setForeground(self.taskbox)
+        highlight_fmt = QTextCharFormat(); highlight_fmt.setForeground(self.highlight)
+        self._fmt_by_name = {
+            'code': code_fmt, 'image': image_fmt, 'footnote': footnote_fmt, 'link': link_fmt,
+            'bold_star': bold_fmt, 'bold_under': bold_fmt, 'italic_star': italic_fmt, 'italic_under': italic_fmt,
+            'strike': strike_fmt, 'task': task_fmt, 'highlight': highlight_fmt,
+        }
 
     def highlightBlock(self, text):
-        for pattern, fmt in self.rules:
-            for match in re.finditer(pattern, text):
+        # Qt clears a block's formats before calling us, so a known line replays its cached ranges
+        for start, length, fmt in self._ranges_for(text):
+            self.setFormat(start, length, fmt)
+
+    def _compute_ranges(self, text):
+        ranges = []
+        self._highlight_line_prefix(text, ranges)
+        if any(trigger in text for trigger in self._INLINE_TRIGGERS):
+            fmt_by_name = self._fmt_by_name
+            for match in self._INLINE_RE.finditer(text):
                 start, end = match.start(), match.end()
-                self.setFormat(start, end - start, fmt)
+                ranges.append((start, end - start, fmt_by_name[match.lastgroup]))
+        return tuple(ranges)
+
+    def _highlight_line_prefix(self, text, ranges):
+        """Headings, blockquotes, horizontal rules and list markers via str checks instead of regex."""
+        first = text[:1]
+        if first == '#':
+            # ^(#{1,6})\s.*
+            hashes = len(text) - len(text.lstrip('#'))
+            if hashes <= 6 and text[hashes:hashes + 1].isspace():
+                ranges.append((0, len(text), self.heading_fmt))
+            return
+        if first == '>':
+            # ^>.*
+            ranges.append((0, len(text), self.blockquote_fmt))
+            return
+        if first == '-' and len(text) >= 3 and not text.strip('-'):
+            # ^---+$
+            ranges.append((0, len(text), self.hr_fmt))
+            return
+        # ^(\s*[-+*]|\s*\d+\.)\s
+        stripped = text.lstrip()
+        marker = stripped[:1]
+        if not marker:
+            return
+        end = len(text) - len(stripped)
+        if marker in '-+*':
+            end += 1
+        elif marker.isdigit():
+            digits = len(stripped) - len(stripped.lstrip('0123456789'))
+            if stripped[digits:digits + 1] != '.':
+                return
+            end += digits + 1
+        else:
+            return
+        if text[end:end + 1].isspace():
+            ranges.append((0, end + 1, self.listitem_fmt))
 
-class AutoPairTextEdit(QTextEdit):
+class AutoPairTextEdit(QPlainTextEdit):
     pairs = {
         '(': ')',
         '[': ']',
@@ -95,13 +528,19 @@ class AutoPairTextEdit(QTextEdit):
 
     def keyPressEvent(self, event):
         key = event.text()
+        if key != '$' and key not in self.pairs:
+            # Ordinary typing: skip the cursor/document lookups below
+            super().keyPressEvent(event)
+            return
         cursor = self.textCursor()
-        doc = self.document()
+        # Neighbouring characters come from the current line only, never the whole document
+        block_text = cursor.block().text()
+        column = _utf16_to_index(block_text, cursor.positionInBlock())
+        prev_char = block_text[column - 1:column] if column > 0 else ''
+        next_char = block_text[column:column + 1]
         # --- Special: Auto-insert ```mermaid code block at line start ---
         if key == '`':
-            block = cursor.block()
-            block_text = block.text()[:cursor.positionInBlock()]
-            if block_text.strip() == '':
+            if block_text[:column].strip() == '':
                 # At start of line, insert mermaid block
                 selected = cursor.selectedText()
                 mermaid_block = '```mermaid\n' + (selected if selected else '') + '\n```'
@@ -114,7 +553,6 @@ class AutoPairTextEdit(QTextEdit):
                 return
         # --- Special: Auto-pair $$ for math blocks ---
         if key == '$':
-            prev_char = self.toPlainText()[cursor.position()-1:cursor.position()]
             if prev_char == '$':
                 # Remove the just-inserted $ (so only one pair is inserted)
                 cursor.deletePreviousChar()
@@ -139,15 +577,568 @@ class AutoPairTextEdit(QTextEdit):
                 self.setTextCursor(cursor)
                 return
             else:
-                after = self.toPlainText()[cursor.position():cursor.position()+1]
-                if after != closing:
+                if next_char != closing:
                     cursor.insertText(key + closing)
                     cursor.movePosition(cursor.MoveOperation.Left)
                     self.setTextCursor(cursor)
                     return
         super().keyPressEvent(event)
 
+# Static body of the Info & Tips dialog
+_INFO_GUIDE = r"""Editor Pane (left):
+- Type Markdown here. Syntax highlighting, auto-pairing, and keyboard shortcuts are supported.
+
+Preview Pane (right):
+- Shows a live preview of your Markdown, including diagrams and math.
+
+---
+
+Mermaid Diagrams:
+To render a diagram, use:
+
+```mermaid
+graph TD
+  A --> B
+```
+
+---
+
+MathJax/LaTeX:
+- Inline math: $E=mc^2$
+- Block math:
+  $$
+  x = {-b \pm \sqrt{b^2-4ac} \over 2a}
+  $$
+
+---
+
+Tips:
+- Use the Palette for commands, MD Palette for Markdown snippets.
+- Auto-pairing for (), [], {}, '', "", and ``.
+- Export to HTML, PDF, and more.
+- Syntax highlighting, smart indent, and more."""
+
+# Preview body shown while the editor is empty
+_WELCOME_HTML = (
+    '<section class="welcome">'
+    '<div class="welcome-header">'
+    '<h1>Simple-md</h1>'
+    '<p class="tagline">A premium Markdown & MDX viewer</p>'
+    '</div>'
+    '<p class="lead">Start typing on the left to see a live preview here.</p>'
+    '<div class="cards">'
+    '<div class="card">'
+    '<div class="card-icon">&#9998;</div>'
+    '<div class="card-content">'
+    '<div class="title">Markdown</div>'
+    '<div class="body">Headings, lists, links, tables, code blocks, and more.</div>'
+    '</div>'
+    '</div>'
+    '<div class="card">'
+    '<div class="card-icon">&#8747;</div>'
+    '<div class="card-content">'
+    '<div class="title">Math</div>'
+    '<div class="body">Inline <code>$E=mc^2$</code> and block <code>$$...$$</code> equations.</div>'
+    '</div>'
+    '</div>'
+    '<div class="card">'
+    '<div class="card-icon">&#9670;</div>'
+    '<div class="card-content">'
+    '<div class="title">Mermaid</div>'
+    '<div class="body">Use <code>```mermaid</code> fences to render diagrams.</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+    '<div class="keyboard-hints">'
+    '<span class="hint"><kbd>/</kbd> Syntax popup</span>'
+    '<span class="hint"><kbd>[[</kbd> WikiLinks</span>'
+    '<span class="hint"><kbd>$$</kbd> Math blocks</span>'
+    '</div>'
+    '</section>'
+)
+
+# Banner prepended to the preview body when MDX components were turned into code blocks
+_MDX_NOTE_HTML = '<div class="note"><span class="note-icon">&#9432;</span> MDX preview: component blocks are shown as <code>jsx</code> code.</div>'
+
+# Opening of the preview scaffold <head>: charset, fonts and the premium theme styles
+_PREVIEW_STYLE = '''
+<head>
+<meta charset="utf-8">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+<style>
+    :root {
+        --bg-deep: #0d0f14;
+        --bg-primary: #12151c;
+        --bg-elevated: #1a1e28;
+        --bg-glass: rgba(26, 30, 40, 0.75);
+        --text-primary: #e4e8f1;
+        --text-secondary: #a0a8b8;
+        --text-muted: #6b7280;
+        --accent-blue: #7aa2f7;
+        --accent-purple: #bb9af7;
+        --accent-teal: #73daca;
+        --accent-amber: #e0af68;
+        --border-subtle: rgba(255, 255, 255, 0.06);
+        --border-medium: rgba(255, 255, 255, 0.1);
+        --code-bg: rgba(255, 255, 255, 0.05);
+        --shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
+    }
+    
+    * { box-sizing: border-box; }
+    
+    html {
+        background: var(--bg-deep);
+        scrollbar-width: thin;
+        scrollbar-color: rgba(255,255,255,0.12) transparent;
+    }
+    
+    ::-webkit-scrollbar { width: 8px; height: 8px; }
+    ::-webkit-scrollbar-track { background: transparent; }
+    ::-webkit-scrollbar-thumb { 
+        background: rgba(255,255,255,0.12); 
+        border-radius: 4px;
+    }
+    ::-webkit-scrollbar-thumb:hover { background: rgba(122, 162, 247, 0.35); }
+    
+    body {
+        margin: 0;
+        padding: 32px 24px 48px 24px;
+        background: linear-gradient(180deg, var(--bg-deep) 0%, var(--bg-primary) 100%);
+        color: var(--text-primary);
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        font-size: 15px;
+        line-height: 1.7;
+        -webkit-font-smoothing: antialiased;
+        -moz-osx-font-smoothing: grayscale;
+        min-height: 100vh;
+    }
+    
+    .doc {
+        max-width: 820px;
+        margin: 0 auto;
+        background: var(--bg-glass);
+        backdrop-filter: blur(12px);
+        -webkit-backdrop-filter: blur(12px);
+        border: 1px solid var(--border-subtle);
+        border-radius: 20px;
+        padding: 32px 36px;
+        box-shadow: var(--shadow);
+    }
+    
+    /* === Typography === */
+    h1, h2, h3, h4, h5, h6 {
+        color: var(--text-primary);
+        font-weight: 600;
+        letter-spacing: -0.02em;
+        margin: 1.5em 0 0.6em 0;
+        line-height: 1.3;
+    }
+    h1:first-child, h2:first-child, h3:first-child { margin-top: 0; }
+    h1 { font-size: 2.2em; font-weight: 700; }
+    h2 { font-size: 1.65em; }
+    h3 { font-size: 1.35em; }
+    h4 { font-size: 1.15em; }
+    
+    p { margin: 0.9em 0; color: var(--text-secondary); }
+    
+    a { 
+        color: var(--accent-blue); 
+        text-decoration: none;
+        transition: color 0.2s ease;
+    }
+    a:hover { 
+        color: var(--accent-purple);
+        text-decoration: underline; 
+    }
+    
+    strong { color: var(--text-primary); font-weight: 600; }
+    em { font-style: italic; }
+    
+    /* === Lists === */
+    ul, ol { 
+        margin: 1em 0; 
+        padding-left: 1.5em;
+        color: var(--text-secondary);
+    }
+    li { margin: 0.4em 0; }
+    li::marker { color: var(--accent-teal); }
+    
+    /* === Horizontal Rule === */
+    hr { 
+        border: none; 
+        height: 1px;
+        background: linear-gradient(90deg, transparent, var(--border-medium), transparent);
+        margin: 2em 0; 
+    }
+    
+    /* === Blockquote === */
+    blockquote {
+        margin: 1.5em 0;
+        padding: 1em 1.25em;
+        background: rgba(122, 162, 247, 0.06);
+        border-left: 3px solid var(--accent-blue);
+        border-radius: 0 12px 12px 0;
+        color: var(--text-secondary);
+        font-style: italic;
+    }
+    blockquote p { margin: 0.5em 0; }
+    blockquote p:first-child { margin-top: 0; }
+    blockquote p:last-child { margin-bottom: 0; }
+    
+    /* === Code === */
+    code {
+        font-family: 'SF Mono', 'Fira Code', 'JetBrains Mono', Menlo, Monaco, 'Courier New', monospace;
+        font-size: 0.9em;
+        background: var(--code-bg);
+        padding: 0.2em 0.5em;
+        border-radius: 6px;
+        color: var(--accent-teal);
+    }
+    
+    pre {
+        background: var(--code-bg);
+        border: 1px solid var(--border-subtle);
+        border-radius: 12px;
+        padding: 18px 20px;
+        overflow-x: auto;
+        margin: 1.5em 0;
+    }
+    pre code {
+        background: none;
+        padding: 0;
+        font-size: 0.88em;
+        line-height: 1.6;
+        color: var(--text-secondary);
+    }
+    
+    /* === Tables === */
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 1.5em 0;
+        background: rgba(255, 255, 255, 0.02);
+        border: 1px solid var(--border-subtle);
+        border-radius: 12px;
+        overflow: hidden;
+    }
+    th, td { 
+        padding: 12px 16px; 
+        text-align: left;
+        border-bottom: 1px solid var(--border-subtle); 
+    }
+    th { 
+        background: rgba(255, 255, 255, 0.04); 
+        color: var(--text-primary);
+        font-weight: 600;
+        font-size: 0.9em;
+        text-transform: uppercase;
+        letter-spacing: 0.03em;
+    }
+    tr:last-child td { border-bottom: none; }
+    tr:hover td { background: rgba(255, 255, 255, 0.02); }
+    
+    /* === Images === */
+    img { 
+        max-width: 100%; 
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
+    }
+    
+    /* === Mermaid Diagrams === */
+    .mermaid { 
+        white-space: normal;
+        background: rgba(255, 255, 255, 0.03); 
+        border: 1px solid var(--border-subtle); 
+        border-radius: 16px; 
+        margin: 1.5em 0; 
+        padding: 1.5em;
+        text-align: center;
+    }
+    
+    /* === Notes/Alerts === */
+    .note {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        background: rgba(187, 154, 247, 0.08);
+        border: 1px solid rgba(187, 154, 247, 0.25);
+        color: var(--text-secondary);
+        padding: 12px 16px;
+        border-radius: 12px;
+        margin: 0 0 20px 0;
+        font-size: 0.92em;
+    }
+    .note-icon {
+        color: var(--accent-purple);
+        font-size: 1.1em;
+    }
+    
+    /* === Welcome Screen === */
+    .welcome {
+        text-align: center;
+        padding: 20px 0;
+    }
+    .welcome-header {
+        margin-bottom: 8px;
+    }
+    .welcome h1 {
+        font-size: 2.8em;
+        margin: 0;
+        background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple));
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+    .welcome .tagline {
+        color: var(--text-muted);
+        font-size: 1em;
+        margin: 8px 0 0 0;
+        font-weight: 400;
+    }
+    .welcome .lead {
+        font-size: 1.1em;
+        color: var(--text-secondary);
+        margin: 24px 0 32px 0;
+    }
+    
+    .cards {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 16px;
+        text-align: left;
+    }
+    .card {
+        background: rgba(255, 255, 255, 0.03);
+        border: 1px solid var(--border-subtle);
+        border-radius: 16px;
+        padding: 20px;
+        transition: all 0.25s ease;
+    }
+    .card:hover {
+        background: rgba(255, 255, 255, 0.05);
+        border-color: var(--border-medium);
+        transform: translateY(-2px);
+    }
+    .card-icon {
+        font-size: 1.5em;
+        margin-bottom: 12px;
+        color: var(--accent-blue);
+    }
+    .card .title {
+        font-weight: 600;
+        color: var(--text-primary);
+        margin-bottom: 8px;
+        font-size: 1.05em;
+    }
+    .card .body {
+        color: var(--text-muted);
+        font-size: 0.9em;
+        line-height: 1.5;
+    }
+    
+    .keyboard-hints {
+        display: flex;
+        justify-content: center;
+        gap: 24px;
+        margin-top: 32px;
+        flex-wrap: wrap;
+    }
+    .hint {
+        color: var(--text-muted);
+        font-size: 0.85em;
+    }
+    kbd {
+        display: inline-block;
+        background: rgba(255, 255, 255, 0.08);
+        border: 1px solid var(--border-medium);
+        border-radius: 6px;
+        padding: 3px 8px;
+        font-family: inherit;
+        font-size: 0.9em;
+        margin-right: 6px;
+        color: var(--text-secondary);
+    }
+    
+    @media (max-width: 700px) {
+        .cards { grid-template-columns: 1fr; }
+        .doc { padding: 24px 20px; }
+        body { padding: 20px 16px 32px 16px; }
+    }
+</style>
+'''
+
+# Preview page script (page world): typesets math and draws diagrams in the nodes the bridge
+# script (below) has just inserted. It never sees the QWebChannel.
+_PREVIEW_SCRIPT = r'''
+<script type="text/javascript">
+// MathJax and Mermaid are only fetched the first time the content needs them;
+// window.previewLibs holds their URLs (bundled copy or CDN)
+const libsRequested = {};
+const loadLib = (name, id, onload) => {
+    if (libsRequested[name]) { return; }
+    libsRequested[name] = true;
+    const script = document.createElement('script');
+    if (id) { script.id = id; }
+    script.src = window.previewLibs[name];
+    script.async = true;
+    if (onload) { script.onload = onload; }
+    document.head.appendChild(script);
+};
+// Default MathJax delimiters: $$...$$, \[...\] and \(...\)
+const MATH_RE = /\$\$|\\\[|\\\(/;
+// ```mermaid fences arrive as ordinary code blocks (pre > code.language-mermaid). Each <pre> is
+// turned into the diagram host in place, so the top-level nodes stay the ones the bridge script
+// is tracking; until Mermaid has loaded, the blocks stay as code.
+const MERMAID_SELECTOR = 'pre > code.language-mermaid';
+let mermaidReady = false;
+const drawDiagrams = (codes) => {
+    const hosts = codes.map((code) => {
+        const pre = code.parentElement;
+        pre.className = 'mermaid';
+        pre.textContent = code.textContent;
+        return pre;
+    });
+    if (hosts.length) { mermaid.run({ nodes: hosts }); }
+};
+const startMermaid = () => {
+    mermaid.initialize({ startOnLoad: false, theme: 'dark' });
+    mermaidReady = true;
+    drawDiagrams(Array.from(document.getElementById('content').querySelectorAll(MERMAID_SELECTOR)));
+};
+// The bridge script marks top-level nodes it is about to drop (data-stale) and the ones it
+// just inserted (data-fresh), then fires 'previewupdate' synchronously.
+document.addEventListener('previewupdate', () => {
+    const root = document.getElementById('content');
+    const removed = Array.from(root.querySelectorAll(':scope > [data-stale]'));
+    const elements = Array.from(root.querySelectorAll(':scope > [data-fresh]'));
+    elements.forEach((el) => el.removeAttribute('data-fresh'));
+    if (window.MathJax && MathJax.typesetClear && removed.length) { MathJax.typesetClear(removed); }
+    if (!elements.length) { return; }
+    const math = elements.filter((el) => MATH_RE.test(el.textContent));
+    if (math.length) {
+        if (window.MathJax && MathJax.startup) {
+            MathJax.startup.promise = MathJax.startup.promise
+                .then(() => MathJax.typesetPromise(math))
+                .catch((err) => console.error(err));
+        } else {
+            loadLib('mathjax', 'MathJax-script');  // Typesets the whole page once it has loaded
+        }
+    }
+    const diagrams = elements.flatMap((el) => Array.from(el.querySelectorAll(MERMAID_SELECTOR)));
+    if (diagrams.length) {
+        if (mermaidReady) {
+            drawDiagrams(diagrams);
+        } else {
+            loadLib('mermaid', null, startMermaid);  // Draws every pending diagram once loaded
+        }
+    }
+});
+</script>
+'''
+
+# Bridge script, injected into the isolated application world with qwebchannel.js. Scripts in
+# the page (or on any site a link might lead to) cannot reach qt.webChannelTransport from there.
+_PREVIEW_BRIDGE_SCRIPT = r'''
+(() => {
+    if (location.href.split('#')[0] !== '%(base)s') { return; }  // The scaffold page only
+    // Swap only the top-level nodes that changed, so typeset math and rendered diagrams
+    // elsewhere in the document survive. Each shown node is kept with the markup it was
+    // parsed from, since MathJax and Mermaid rewrite the live DOM.
+    let shown = [];  // [{ node, src }] for the children of #content, in order
+    const sourceOf = (node) => node.nodeType === Node.ELEMENT_NODE ? node.outerHTML : node.nodeValue;
+    const updateContent = (html) => {
+        const root = document.getElementById('content');
+        const template = document.createElement('template');
+        template.innerHTML = html;
+        const fresh = Array.from(template.content.childNodes, (node) => ({ node, src: sourceOf(node) }));
+        let head = 0;
+        while (head < shown.length && head < fresh.length && shown[head].src === fresh[head].src) { head++; }
+        let tail = 0;
+        while (tail < shown.length - head && tail < fresh.length - head
+               && shown[shown.length - 1 - tail].src === fresh[fresh.length - 1 - tail].src) { tail++; }
+        const removed = shown.slice(head, shown.length - tail);
+        const added = fresh.slice(head, fresh.length - tail);
+        const anchor = tail ? shown[shown.length - tail].node : null;
+        const isElement = ({ node }) => node.nodeType === Node.ELEMENT_NODE;
+        removed.filter(isElement).forEach(({ node }) => node.setAttribute('data-stale', ''));
+        added.forEach(({ node }) => {
+            if (node.nodeType === Node.ELEMENT_NODE) { node.setAttribute('data-fresh', ''); }
+            root.insertBefore(node, anchor);
+        });
+        shown = shown.slice(0, head).concat(added, shown.slice(shown.length - tail));
+        document.dispatchEvent(new Event('previewupdate'));
+        removed.forEach(({ node }) => node.remove());
+    };
+    // Python sends (prefix, suffix, middle): keep both ends of the current body, swap the middle
+    let currentHtml = '';
+    new QWebChannel(qt.webChannelTransport, (channel) => {
+        const bridge = channel.objects.bridge;
+        bridge.contentPatched.connect((prefix, suffix, middle) => {
+            currentHtml = currentHtml.slice(0, prefix) + middle + currentHtml.slice(currentHtml.length - suffix);
+            updateContent(currentHtml);
+        });
+        bridge.ready();
+    });
+})();
+'''
+
+def _preview_bridge_source():
+    """qwebchannel.js (from Qt's resources) followed by the bridge script."""
+    qwebchannel = QFile(':/qtwebchannel/qwebchannel.js')
+    if not qwebchannel.open(QIODevice.OpenModeFlag.ReadOnly):
+        return ''
+    try:
+        client = bytes(qwebchannel.readAll()).decode('utf-8')
+    finally:
+        qwebchannel.close()
+    return client + _PREVIEW_BRIDGE_SCRIPT % {'base': PREVIEW_BASE_URL}
+
+@functools.lru_cache(maxsize=None)
+def _preview_scaffold_bytes():
+    """Full preview page with an empty body as UTF-8; encoded once, reused for every scaffold (re)load."""
+    # Relative paths resolve against PREVIEW_BASE_URL, which _preview_scheme_handler maps to resources/
+    mathjax_src = MATHJAX_LOCAL.relative_to(RESOURCES_DIR).as_posix() if MATHJAX_LOCAL.exists() else MATHJAX_CDN
+    mermaid_src = MERMAID_LOCAL.relative_to(RESOURCES_DIR).as_posix() if MERMAID_LOCAL.exists() else MERMAID_CDN
+    html_head = f'''{_PREVIEW_STYLE}
+    <!-- MathJax and Mermaid.js: loaded on demand by the preview script -->
+    <script type="text/javascript">window.previewLibs = {{ mathjax: '{mathjax_src}', mermaid: '{mermaid_src}' }};</script>
+    {_PREVIEW_SCRIPT}</head>'''
+    page = f'<!DOCTYPE html><html>{html_head}<body><main class="doc" id="content"></main></body></html>'
+    return QByteArray(page.encode('utf-8'))
+
 class MarkdownEditor(QMainWindow):
+    # Markdown Palette entries: (Display, Syntax)
+    _MD_ELEMENTS = (
+        ("Heading 1", "# H1"),
+        ("Heading 2", "## H2"),
+        ("Heading 3", "### H3"),
+        ("Bold", "**bold text**"),
+        ("Italic", "*italicized text*"),
+        ("Blockquote", "> blockquote"),
+        ("Ordered List", "1. First item\n2. Second item\n3. Third item"),
+        ("Unordered List", "- First item\n- Second item\n- Third item"),
+        ("Inline Code", "`code`"),
+        ("Horizontal Rule", "---"),
+        ("Link", "[title](https://www.example.com)"),
+        ("Image", "![alt text](image.jpg)"),
+        ("Table", "| Syntax | Description |\n| ----------- | ----------- |\n| Header | Title |\n| Paragraph | Text |"),
+        ("Fenced Code Block", "```\ncode\n```"),
+        ("Footnote", "Here's a sentence with a footnote. [^1]\n\n[^1]: This is the footnote."),
+        ("Heading ID", "### My Great Heading {#custom-id}"),
+        ("Definition List", "term\n: definition"),
+        ("Strikethrough", "~~The world is flat.~~"),
+        ("Task List", "- [x] Write the press release\n- [ ] Update the website\n- [ ] Contact the media"),
+        ("Emoji", "That is so funny! :joy:"),
+        ("Highlight", "I need to highlight these ==very important words==."),
+        ("Subscript", "H~2~O"),
+        ("Superscript", "X^2^"),
+    )
+    # Parallel per-row views of _MD_ELEMENTS: filtering scans only labels, inserting reads only syntax
+    _MD_LABELS, _MD_SYNTAX = zip(*_MD_ELEMENTS)
+    _MD_LABELS_LOWER = tuple(map(str.lower, _MD_LABELS))
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Simple-md")
@@ -155,23 +1146,44 @@ class MarkdownEditor(QMainWindow):
         self.resize(1000, 700)
         self.current_file = None
         # Debounce timer to prevent preview flickering
-        from PyQt6.QtCore import QTimer
-        self._preview_timer = QTimer()
+        self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
         self._preview_timer.setInterval(150)  # 150ms debounce
         self._preview_timer.timeout.connect(self._do_update_preview)
-        self._load_custom_fonts()
+        # Word/char counts are cosmetic; recount once typing pauses instead of per keystroke
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(250)
+        self._status_timer.timeout.connect(self._update_status_bar)
+        self._mdx_cache = None  # (source, current_file, _convert_mdx result) from the last conversion
+        self._last_render_ms = 0.0  # Duration of the last Markdown render, drives the debounce
+        self._last_md_text = None  # Source of the last rendered preview
+        self._last_revision = None  # Editor document revision at the last render
+        self._last_html = None  # Last body HTML pushed to the preview
+        self._preview_ready = False  # True once the scaffold's QWebChannel has connected
+        self._preview_loading = False
+        self._shown_html = ''  # Body HTML the page currently holds
+        # One worker thread, so saves, loads and exports run in the order they were requested.
+        # The pool is a child of the window: destroying the window waits for in-flight I/O.
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._io_tasks = set()  # Keeps in-flight _IOTask objects alive
+        self._load_generation = 0  # Bumped by every open and New File; older reads are dropped
+        self._command_palette = None  # Palette dialogs, built on first open
+        self._md_palette = None
+        self._info_dialog = None  # Info & Tips dialog, built on first open
+        self._export_menu = None  # Toolbar export popup, built on first click
+        self._pdf_doc = None  # PDF export document and printer, built on first export
+        self._pdf_printer = None
         self._setup_ui()
         self._setup_menu()
         self._setup_syntax_popup()
         self.setAcceptDrops(True)  # Enable drag-and-drop
+        self._load_custom_fonts()
 
     def _load_custom_fonts(self):
-        # Load all TTF fonts from resources/TTF
-        font_dir = FONTS_DIR
-        if font_dir.exists():
-            for font_file in font_dir.glob('*.ttf'):
-                QFontDatabase.addApplicationFont(str(font_file))
+        # Register the TTF fonts from resources/TTF on the thread pool, overlapping the first paint
+        self._run_io(_register_fonts, (FONTS_DIR,), lambda _: None, "Failed to load fonts")
 
     def _setup_ui(self):
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -180,9 +1192,37 @@ class MarkdownEditor(QMainWindow):
         font = QFont()
         font.setPointSize(13)
         self.editor.setFont(font)
+        # QtWebEngine loads Chromium, so it is imported here rather than at module import
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebEngineCore import QWebEngineSettings
         self.preview = QWebEngineView()
+        self.preview.setPage(_preview_page(self.preview))
+        # Bundled scripts come through the preview scheme; the page itself never gets file:// access
+        self._scheme_handler = _preview_scheme_handler(self)
+        self.preview.page().profile().installUrlSchemeHandler(PREVIEW_SCHEME, self._scheme_handler)
+        self.preview.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, False)
+        # Body updates travel as small splices over a QWebChannel instead of whole documents
+        from PyQt6.QtWebChannel import QWebChannel
+        self._bridge = _PreviewBridge(self)
+        self._bridge.pageReady.connect(self._on_preview_ready)
+        self._channel = QWebChannel(self)
+        self._channel.registerObject('bridge', self._bridge)
+        # Only the injected bridge script, in the isolated application world, can reach the channel
+        from PyQt6.QtWebEngineCore import QWebEngineScript
+        world = QWebEngineScript.ScriptWorldId.ApplicationWorld
+        self.preview.page().setWebChannel(self._channel, world)
+        bridge_script = QWebEngineScript()
+        bridge_script.setName('simple-md-bridge')
+        bridge_script.setSourceCode(_preview_bridge_source())
+        bridge_script.setWorldId(world)
+        bridge_script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        bridge_script.setRunsOnSubFrames(False)
+        self.preview.page().scripts().insert(bridge_script)
+        self.preview.loadStarted.connect(self._on_preview_load_started)
+        self.preview.loadFinished.connect(self._on_preview_loaded)
+        self._load_preview_scaffold()
         self.editor.textChanged.connect(self.update_preview)
-        self.editor.textChanged.connect(self._update_status_bar)
+        self.editor.textChanged.connect(self._status_timer.start)
         self.editor.installEventFilter(self)
         # Attach Markdown syntax highlighter
         self.highlighter = MarkdownHighlighter(self.editor.document())
@@ -190,8 +1230,8 @@ class MarkdownEditor(QMainWindow):
         splitter.addWidget(self.preview)
         splitter.setSizes([600, 400])
         self.setCentralWidget(splitter)
-        # Use markdown2 for robust Markdown support
-        self.markdown = markdown2.markdown
+        # cmark-gfm, mistune or markdown2 (see _markdown_renderer), remembering the last export render
+        self.markdown = _render_export_md
 
         # Add a text-only toolbar for core actions
         toolbar = self.addToolBar('Main Toolbar')
@@ -242,7 +1282,7 @@ class MarkdownEditor(QMainWindow):
     def _update_status_bar(self):
         """Update status bar with word and character count."""
         text = self.editor.toPlainText()
-        words = len(text.split()) if text.strip() else 0
+        words = len(text.split())  # Whitespace-only text splits to []
         chars = len(text)
         self.word_count_label.setText(f"{words:,} words")
         self.char_count_label.setText(f"{chars:,} chars")
@@ -313,11 +1353,24 @@ class MarkdownEditor(QMainWindow):
             ("important", "#important"),
             ("idea", "#idea"),
         ]
-        self.syntax_popup = QListWidget(self)
+        # Parallel (labels, snippets) per trigger: the model takes the labels list as-is
+        # and a source row indexes straight into the snippets
+        self._popup_sources = {
+            trigger: ([label for label, _ in items], [snippet for _, snippet in items])
+            for trigger, items in (("/", self.syntax_items), ("[[", self.wikilink_items), ("#", self.tag_items))
+        }
+        # Labels live in a string model; the proxy does the substring filtering in C++
+        self._popup_model = QStringListModel(self)
+        self._popup_proxy = QSortFilterProxyModel(self)
+        self._popup_proxy.setSourceModel(self._popup_model)
+        self._popup_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.syntax_popup = QListView(self)
+        self.syntax_popup.setModel(self._popup_proxy)
+        self.syntax_popup.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.syntax_popup.setWindowFlags(Qt.WindowType.Popup)
         self.syntax_popup.hide()
         self.syntax_popup.setStyleSheet('''
-            QListWidget {
+            QListView {
                 background: rgba(18, 21, 28, 0.96);
                 color: #e4e8f1;
                 border: 1px solid rgba(255, 255, 255, 0.1);
@@ -325,55 +1378,59 @@ class MarkdownEditor(QMainWindow):
                 border-radius: 12px;
                 padding: 6px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px 12px;
                 border-radius: 8px;
                 margin: 2px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: rgba(108, 140, 255, 0.18);
                 color: #ffffff;
             }
-            QListWidget::item:hover:!selected {
+            QListView::item:hover:!selected {
                 background: rgba(255, 255, 255, 0.06);
             }
         ''')
-        self.syntax_popup.itemClicked.connect(self.insert_selected_syntax)
+        self.syntax_popup.clicked.connect(lambda _index: self.insert_selected_syntax())
         self._popup_trigger = None
         self._popup_filter = ""
+        self._popup_labels = None
+        self._popup_snippets = []
+        self._popup_applied_filter = ""  # Filter string the proxy currently holds
 
     def show_syntax_popup(self, trigger="/", filter_text=""):
         # Choose items based on trigger
-        if trigger == "/":
-            items = self.syntax_items
-        elif trigger == "[[":
-            items = self.wikilink_items
-        elif trigger == "#":
-            items = self.tag_items
-        else:
-            items = []
-        # Filter items
-        filtered = [item for item in items if filter_text.lower() in item[0].lower()]
-        self.syntax_popup.clear()
-        for item in filtered:
-            self.syntax_popup.addItem(item[0])
-        if filtered:
-            self.syntax_popup.setCurrentRow(0)
-        self.syntax_popup.move(self.editor.mapToGlobal(self.editor.cursorRect().bottomLeft()))
-        self.syntax_popup.show()
-        self.syntax_popup.setFocus()
+        labels, snippets = self._popup_sources.get(trigger, ([], []))
+        # Only reload the model when the item set changes; filtering is incremental
+        if labels is not self._popup_labels:
+            self._popup_labels = labels
+            self._popup_snippets = snippets
+            self._popup_model.setStringList(labels)
+        # Reopening with the filter already applied skips the proxy's full refilter
+        if filter_text != self._popup_applied_filter:
+            self._popup_applied_filter = filter_text
+            self._popup_proxy.setFilterFixedString(filter_text)
+        self._set_popup_row(0)
+        # Refilters while open leave the editor cursor where it was, so only place the popup on open
+        if not self.syntax_popup.isVisible():
+            self.syntax_popup.move(self.editor.mapToGlobal(self.editor.cursorRect().bottomLeft()))
+            self.syntax_popup.show()
+            self.syntax_popup.setFocus()
         self._popup_trigger = trigger
         self._popup_filter = filter_text
-        self._popup_filtered = filtered
+
+    def _set_popup_row(self, row):
+        count = self._popup_proxy.rowCount()
+        if count:
+            self.syntax_popup.setCurrentIndex(self._popup_proxy.index(row % count, 0))
 
     def handle_editor_keypress(self, event: QKeyEvent):
-        cursor = self.editor.textCursor()
         if self.syntax_popup.isVisible():
             if event.key() == Qt.Key.Key_Down:
-                self.syntax_popup.setCurrentRow((self.syntax_popup.currentRow() + 1) % self.syntax_popup.count())
+                self._set_popup_row(self.syntax_popup.currentIndex().row() + 1)
                 return True
             elif event.key() == Qt.Key.Key_Up:
-                self.syntax_popup.setCurrentRow((self.syntax_popup.currentRow() - 1) % self.syntax_popup.count())
+                self._set_popup_row(self.syntax_popup.currentIndex().row() - 1)
                 return True
             elif event.key() in (Qt.Key.Key_Enter, Qt.Key.Key_Return):
                 self.insert_selected_syntax()
@@ -391,13 +1448,17 @@ class MarkdownEditor(QMainWindow):
                 self.show_syntax_popup(self._popup_trigger, self._popup_filter)
                 return True
         # Trigger popup on '/' or '[[' at start of line or after whitespace (NO # trigger)
-        if event.text() == '/':
+        text = event.text()
+        if text not in ('/', '['):
+            return False
+        cursor = self.editor.textCursor()  # Only fetched for keys that can open the popup
+        if text == '/':
             block = cursor.block().text()
             pos = cursor.positionInBlock()
             if block[:pos].strip() == '':
                 self.show_syntax_popup("/")
                 return False
-        elif event.text() == '[':
+        elif text == '[':
             block = cursor.block().text()
             pos = cursor.positionInBlock()
             if pos >= 2 and block[pos-2:pos] == '[[':
@@ -406,11 +1467,11 @@ class MarkdownEditor(QMainWindow):
         return False
 
     def insert_selected_syntax(self):
-        row = self.syntax_popup.currentRow()
-        if row < 0 or not hasattr(self, '_popup_filtered'):
+        index = self.syntax_popup.currentIndex()
+        if not index.isValid():
             self.syntax_popup.hide()
             return
-        syntax = self._popup_filtered[row][1]
+        syntax = self._popup_snippets[self._popup_proxy.mapToSource(index).row()]
         cursor = self.editor.textCursor()
         # Remove trigger and filter text before inserting
         length = len(self._popup_trigger) + len(self._popup_filter)
@@ -423,6 +1484,19 @@ class MarkdownEditor(QMainWindow):
 
     # --- Command Palette ---
     def show_command_palette(self):
+        # Built on first use, then reused: only the search text is reset between opens
+        if self._command_palette is None:
+            self._command_palette = self._build_command_palette()
+        self._open_palette(self._command_palette)
+
+    def _open_palette(self, dialog):
+        dialog.search_box.clear()
+        if dialog.item_list.count() > 0:
+            dialog.item_list.setCurrentRow(0)
+        dialog.search_box.setFocus()
+        dialog.exec()
+
+    def _build_command_palette(self):
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem
         dialog = QDialog(self)
         dialog.setModal(True)
@@ -480,7 +1554,7 @@ class MarkdownEditor(QMainWindow):
         search_box = QLineEdit()
         search_box.setPlaceholderText("Type a command...")
         command_list = QListWidget()
-        commands = [
+        commands = (
             ("New File", self.new_file),
             ("Open File", self.open_file),
             ("Save File", self.save_file),
@@ -491,21 +1565,21 @@ class MarkdownEditor(QMainWindow):
             ("Redo", self.editor.redo),
             ("Cut", self.editor.cut),
             ("Paste", self.editor.paste)
-        ]
-        for cmd, _ in commands:
-            command_list.addItem(cmd)
+        )
+        # Lowercased once here rather than per command on every keystroke
+        commands_lc = tuple((cmd, cmd.lower()) for cmd, _ in commands)
+        command_list.addItems([cmd for cmd, _ in commands])
         command_list.setCurrentRow(0)
         layout.addWidget(search_box)
         layout.addWidget(command_list)
         dialog.setLayout(layout)
         # --- Filtering ---
         def filter_commands():
-            text = search_box.text().lower()
+            needle = search_box.text().lower()
+            matches = [cmd for cmd, cmd_lc in commands_lc if needle in cmd_lc]
             command_list.clear()
-            for cmd, _ in commands:
-                if text in cmd.lower():
-                    command_list.addItem(cmd)
-            if command_list.count() > 0:
+            command_list.addItems(matches)
+            if matches:
                 command_list.setCurrentRow(0)
         search_box.textChanged.connect(filter_commands)
         # --- Keyboard navigation ---
@@ -532,8 +1606,9 @@ class MarkdownEditor(QMainWindow):
         search_box.keyPressEvent = lambda event: (handle_palette_key(event) if handle_palette_key(event) is not None else QLineEdit.keyPressEvent(search_box, event))
         command_list.keyPressEvent = lambda event: handle_palette_key(event)
         dialog.resize(380, 320)
-        search_box.setFocus()
-        dialog.exec()
+        dialog.search_box = search_box
+        dialog.item_list = command_list
+        return dialog
 
     def eventFilter(self, obj, event):
         if obj == self.editor and event.type() == event.Type.KeyPress:
@@ -543,46 +1618,63 @@ class MarkdownEditor(QMainWindow):
     def _looks_like_mdx(self, text: str) -> bool:
         if self.current_file and str(self.current_file).lower().endswith('.mdx'):
             return True
-        if re.search(r'^\s*(import|export)\s', text, flags=re.MULTILINE):
+        # Substring checks rule out plain Markdown without running either regex
+        if ('import' in text or 'export' in text) and _MDX_IMPORT_RE.search(text):
             return True
-        if re.search(r'^\s*<\s*[A-Z][A-Za-z0-9_.-]*\b', text, flags=re.MULTILINE):
+        if '<' in text and _MDX_TAG_RE.search(text):
             return True
         return False
 
     def _mdx_to_markdown(self, text: str):
+        # Preview and exports convert the same buffer, so keep the last result (keyed on the
+        # current file too, since a .mdx name alone makes text count as MDX)
+        cached = self._mdx_cache
+        if cached is not None and cached[1] == self.current_file and cached[0] == text:
+            return cached[2]
+        result = self._convert_mdx(text)
+        self._mdx_cache = (text, self.current_file, result)
+        return result
+
+    def _convert_mdx(self, text: str):
         if not self._looks_like_mdx(text):
             return text, False
 
-        original = text
-
+        # Track edits during the scan instead of comparing the rebuilt document afterwards
         out_lines = []
+        changed = False
         in_component = None
         in_fence = False
         for line in text.splitlines():
-            if re.match(r'^\s*```', line):
+            stripped = line.lstrip()
+            if stripped.startswith('```'):
                 in_fence = not in_fence
                 out_lines.append(line)
                 continue
 
             if not in_fence:
-                if re.match(r'^\s*(import|export)\s', line):
-                    continue
-                line = re.sub(r'\{/\*([\s\S]*?)\*/\}', r'<!--\1-->', line)
+                if stripped[:6] in ('import', 'export') and stripped[6:7].isspace():
+                    changed = True
+                    continue  # ^\s*(import|export)\s
+                if '{/*' in line:
+                    line, comments = _JSX_COMMENT_RE.subn(r'<!--\1-->', line)
+                    if comments:
+                        stripped = line.lstrip()
+                        changed = True
 
             if in_component is not None:
                 out_lines.append(line)
-                if re.search(rf'^\s*</\s*{re.escape(in_component)}\s*>\s*$', line):
+                if _is_close_tag_line(stripped, in_component):
                     out_lines.append('```')
                     in_component = None
                 continue
 
-            if not in_fence:
-                m = re.match(r'^\s*<\s*([A-Z][A-Za-z0-9_.-]*)\b', line)
-                if m:
-                    tag = m.group(1)
+            if not in_fence and stripped.startswith('<'):
+                tag = _jsx_open_tag(stripped)
+                if tag:
+                    changed = True
                     out_lines.append('```jsx')
                     out_lines.append(line)
-                    if re.search(r'/\s*>\s*$', line) or re.search(rf'</\s*{re.escape(tag)}\s*>\s*$', line):
+                    if _is_self_closed(stripped) or _ends_with_close_tag(stripped, tag):
                         out_lines.append('```')
                     else:
                         in_component = tag
@@ -593,413 +1685,147 @@ class MarkdownEditor(QMainWindow):
         if in_component is not None:
             out_lines.append('```')
 
-        rendered = '\n'.join(out_lines)
-        return rendered, rendered != original
+        if not changed:
+            return text, False  # Nothing to convert; skip rebuilding the document
+        return '\n'.join(out_lines), True
 
     def _coerce_save_extension(self, file_path: str, selected_filter: str) -> str:
         p = Path(file_path)
         if p.suffix:
             return file_path
 
-        selected = (selected_filter or '').lower()
-        if '.mdx' in selected:
-            return str(p.with_suffix('.mdx'))
-        return str(p.with_suffix('.md'))
+        # Qt hands back one of the exact _SAVE_FILTERS strings (or '' when none was chosen)
+        return str(p.with_suffix(_SAVE_FILTER_EXT.get(selected_filter, '.md')))
 
     def update_preview(self):
         """Debounced preview update - waits for typing to pause before rendering."""
+        # Wait about three renders' worth, so slow (large) documents don't queue back-to-back renders
+        self._preview_timer.setInterval(min(2000, max(150, int(self._last_render_ms * 3))))
         self._preview_timer.start()
 
     def _do_update_preview(self):
         """Actually render the preview (called after debounce delay)."""
+        # revision() is O(1); skip serializing the document when nothing was edited
+        revision = self.editor.document().revision()
+        if revision == self._last_revision:
+            return
+        self._last_revision = revision
         md_text = self.editor.toPlainText()
+        if md_text == self._last_md_text:
+            return  # Edits since the timer started netted out to no change
+        self._last_md_text = md_text
+        render_start = time.perf_counter()
         md_text, mdx_changed = self._mdx_to_markdown(md_text)
-        # Preprocess: convert mermaid code blocks to <div class="mermaid">...</div>
-        def mermaid_replacer(match):
-            code = match.group(1)
-            return f'<div class="mermaid">{code}</div>'
-        md_text_mermaid = re.sub(r'```mermaid\n([\s\S]*?)```', mermaid_replacer, md_text)
-        # Render Markdown to HTML
-        if md_text_mermaid.strip():
-            html = self.markdown(md_text_mermaid)
+        # Render Markdown to HTML (```mermaid fences stay code blocks; the page script draws them)
+        if md_text.strip():
+            html = _render_md_blocks(md_text)
         else:
-            html = (
-                '<section class="welcome">'
-                '<div class="welcome-header">'
-                '<h1>Simple-md</h1>'
-                '<p class="tagline">A premium Markdown & MDX viewer</p>'
-                '</div>'
-                '<p class="lead">Start typing on the left to see a live preview here.</p>'
-                '<div class="cards">'
-                '<div class="card">'
-                '<div class="card-icon">&#9998;</div>'
-                '<div class="card-content">'
-                '<div class="title">Markdown</div>'
-                '<div class="body">Headings, lists, links, tables, code blocks, and more.</div>'
-                '</div>'
-                '</div>'
-                '<div class="card">'
-                '<div class="card-icon">&#8747;</div>'
-                '<div class="card-content">'
-                '<div class="title">Math</div>'
-                '<div class="body">Inline <code>$E=mc^2$</code> and block <code>$$...$$</code> equations.</div>'
-                '</div>'
-                '</div>'
-                '<div class="card">'
-                '<div class="card-icon">&#9670;</div>'
-                '<div class="card-content">'
-                '<div class="title">Mermaid</div>'
-                '<div class="body">Use <code>```mermaid</code> fences to render diagrams.</div>'
-                '</div>'
-                '</div>'
-                '</div>'
-                '<div class="keyboard-hints">'
-                '<span class="hint"><kbd>/</kbd> Syntax popup</span>'
-                '<span class="hint"><kbd>[[</kbd> WikiLinks</span>'
-                '<span class="hint"><kbd>$$</kbd> Math blocks</span>'
-                '</div>'
-                '</section>'
-            )
-        mdx_note = ''
-        if self._looks_like_mdx(self.editor.toPlainText()) and mdx_changed:
-            mdx_note = '<div class="note"><span class="note-icon">&#9432;</span> MDX preview: component blocks are shown as <code>jsx</code> code.</div>'
-        # Premium HTML styling with refined theme
-        html_head = '''
-        <head>
-        <meta charset="utf-8">
-        <link rel="preconnect" href="https://fonts.googleapis.com">
-        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-        <style>
-            :root {
-                --bg-deep: #0d0f14;
-                --bg-primary: #12151c;
-                --bg-elevated: #1a1e28;
-                --bg-glass: rgba(26, 30, 40, 0.75);
-                --text-primary: #e4e8f1;
-                --text-secondary: #a0a8b8;
-                --text-muted: #6b7280;
-                --accent-blue: #7aa2f7;
-                --accent-purple: #bb9af7;
-                --accent-teal: #73daca;
-                --accent-amber: #e0af68;
-                --border-subtle: rgba(255, 255, 255, 0.06);
-                --border-medium: rgba(255, 255, 255, 0.1);
-                --code-bg: rgba(255, 255, 255, 0.05);
-                --shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-            }
-            
-            * { box-sizing: border-box; }
-            
-            html {
-                background: var(--bg-deep);
-                scrollbar-width: thin;
-                scrollbar-color: rgba(255,255,255,0.12) transparent;
-            }
-            
-            ::-webkit-scrollbar { width: 8px; height: 8px; }
-            ::-webkit-scrollbar-track { background: transparent; }
-            ::-webkit-scrollbar-thumb { 
-                background: rgba(255,255,255,0.12); 
-                border-radius: 4px;
-            }
-            ::-webkit-scrollbar-thumb:hover { background: rgba(122, 162, 247, 0.35); }
-            
-            body {
-                margin: 0;
-                padding: 32px 24px 48px 24px;
-                background: linear-gradient(180deg, var(--bg-deep) 0%, var(--bg-primary) 100%);
-                color: var(--text-primary);
-                font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                font-size: 15px;
-                line-height: 1.7;
-                -webkit-font-smoothing: antialiased;
-                -moz-osx-font-smoothing: grayscale;
-                min-height: 100vh;
-            }
-            
-            .doc {
-                max-width: 820px;
-                margin: 0 auto;
-                background: var(--bg-glass);
-                backdrop-filter: blur(12px);
-                -webkit-backdrop-filter: blur(12px);
-                border: 1px solid var(--border-subtle);
-                border-radius: 20px;
-                padding: 32px 36px;
-                box-shadow: var(--shadow);
-            }
-            
-            /* === Typography === */
-            h1, h2, h3, h4, h5, h6 {
-                color: var(--text-primary);
-                font-weight: 600;
-                letter-spacing: -0.02em;
-                margin: 1.5em 0 0.6em 0;
-                line-height: 1.3;
-            }
-            h1:first-child, h2:first-child, h3:first-child { margin-top: 0; }
-            h1 { font-size: 2.2em; font-weight: 700; }
-            h2 { font-size: 1.65em; }
-            h3 { font-size: 1.35em; }
-            h4 { font-size: 1.15em; }
-            
-            p { margin: 0.9em 0; color: var(--text-secondary); }
-            
-            a { 
-                color: var(--accent-blue); 
-                text-decoration: none;
-                transition: color 0.2s ease;
-            }
-            a:hover { 
-                color: var(--accent-purple);
-                text-decoration: underline; 
-            }
-            
-            strong { color: var(--text-primary); font-weight: 600; }
-            em { font-style: italic; }
-            
-            /* === Lists === */
-            ul, ol { 
-                margin: 1em 0; 
-                padding-left: 1.5em;
-                color: var(--text-secondary);
-            }
-            li { margin: 0.4em 0; }
-            li::marker { color: var(--accent-teal); }
-            
-            /* === Horizontal Rule === */
-            hr { 
-                border: none; 
-                height: 1px;
-                background: linear-gradient(90deg, transparent, var(--border-medium), transparent);
-                margin: 2em 0; 
-            }
-            
-            /* === Blockquote === */
-            blockquote {
-                margin: 1.5em 0;
-                padding: 1em 1.25em;
-                background: rgba(122, 162, 247, 0.06);
-                border-left: 3px solid var(--accent-blue);
-                border-radius: 0 12px 12px 0;
-                color: var(--text-secondary);
-                font-style: italic;
-            }
-            blockquote p { margin: 0.5em 0; }
-            blockquote p:first-child { margin-top: 0; }
-            blockquote p:last-child { margin-bottom: 0; }
-            
-            /* === Code === */
-            code {
-                font-family: 'SF Mono', 'Fira Code', 'JetBrains Mono', Menlo, Monaco, 'Courier New', monospace;
-                font-size: 0.9em;
-                background: var(--code-bg);
-                padding: 0.2em 0.5em;
-                border-radius: 6px;
-                color: var(--accent-teal);
-            }
-            
-            pre {
-                background: var(--code-bg);
-                border: 1px solid var(--border-subtle);
-                border-radius: 12px;
-                padding: 18px 20px;
-                overflow-x: auto;
-                margin: 1.5em 0;
-            }
-            pre code {
-                background: none;
-                padding: 0;
-                font-size: 0.88em;
-                line-height: 1.6;
-                color: var(--text-secondary);
-            }
-            
-            /* === Tables === */
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 1.5em 0;
-                background: rgba(255, 255, 255, 0.02);
-                border: 1px solid var(--border-subtle);
-                border-radius: 12px;
-                overflow: hidden;
-            }
-            th, td { 
-                padding: 12px 16px; 
-                text-align: left;
-                border-bottom: 1px solid var(--border-subtle); 
-            }
-            th { 
-                background: rgba(255, 255, 255, 0.04); 
-                color: var(--text-primary);
-                font-weight: 600;
-                font-size: 0.9em;
-                text-transform: uppercase;
-                letter-spacing: 0.03em;
-            }
-            tr:last-child td { border-bottom: none; }
-            tr:hover td { background: rgba(255, 255, 255, 0.02); }
-            
-            /* === Images === */
-            img { 
-                max-width: 100%; 
-                border-radius: 12px;
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-            }
-            
-            /* === Mermaid Diagrams === */
-            .mermaid { 
-                background: rgba(255, 255, 255, 0.03); 
-                border: 1px solid var(--border-subtle); 
-                border-radius: 16px; 
-                margin: 1.5em 0; 
-                padding: 1.5em;
-                text-align: center;
-            }
-            
-            /* === Notes/Alerts === */
-            .note {
-                display: flex;
-                align-items: center;
-                gap: 10px;
-                background: rgba(187, 154, 247, 0.08);
-                border: 1px solid rgba(187, 154, 247, 0.25);
-                color: var(--text-secondary);
-                padding: 12px 16px;
-                border-radius: 12px;
-                margin: 0 0 20px 0;
-                font-size: 0.92em;
-            }
-            .note-icon {
-                color: var(--accent-purple);
-                font-size: 1.1em;
-            }
-            
-            /* === Welcome Screen === */
-            .welcome {
-                text-align: center;
-                padding: 20px 0;
-            }
-            .welcome-header {
-                margin-bottom: 8px;
-            }
-            .welcome h1 {
-                font-size: 2.8em;
-                margin: 0;
-                background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple));
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }
-            .welcome .tagline {
-                color: var(--text-muted);
-                font-size: 1em;
-                margin: 8px 0 0 0;
-                font-weight: 400;
-            }
-            .welcome .lead {
-                font-size: 1.1em;
-                color: var(--text-secondary);
-                margin: 24px 0 32px 0;
-            }
-            
-            .cards {
-                display: grid;
-                grid-template-columns: repeat(3, 1fr);
-                gap: 16px;
-                text-align: left;
-            }
-            .card {
-                background: rgba(255, 255, 255, 0.03);
-                border: 1px solid var(--border-subtle);
-                border-radius: 16px;
-                padding: 20px;
-                transition: all 0.25s ease;
-            }
-            .card:hover {
-                background: rgba(255, 255, 255, 0.05);
-                border-color: var(--border-medium);
-                transform: translateY(-2px);
-            }
-            .card-icon {
-                font-size: 1.5em;
-                margin-bottom: 12px;
-                color: var(--accent-blue);
-            }
-            .card .title {
-                font-weight: 600;
-                color: var(--text-primary);
-                margin-bottom: 8px;
-                font-size: 1.05em;
-            }
-            .card .body {
-                color: var(--text-muted);
-                font-size: 0.9em;
-                line-height: 1.5;
-            }
-            
-            .keyboard-hints {
-                display: flex;
-                justify-content: center;
-                gap: 24px;
-                margin-top: 32px;
-                flex-wrap: wrap;
-            }
-            .hint {
-                color: var(--text-muted);
-                font-size: 0.85em;
-            }
-            kbd {
-                display: inline-block;
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid var(--border-medium);
-                border-radius: 6px;
-                padding: 3px 8px;
-                font-family: inherit;
-                font-size: 0.9em;
-                margin-right: 6px;
-                color: var(--text-secondary);
-            }
-            
-            @media (max-width: 700px) {
-                .cards { grid-template-columns: 1fr; }
-                .doc { padding: 24px 20px; }
-                body { padding: 20px 16px 32px 16px; }
-            }
-        </style>
-        <!-- MathJax -->
-        <script type="text/javascript" id="MathJax-script" async
-            src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        <!-- Mermaid.js -->
-        <script type="module">
-        import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
-        window.addEventListener('DOMContentLoaded', () => { mermaid.initialize({ startOnLoad: true, theme: 'dark' }); });
-        </script>
-        </head>
-        '''
-        html_full = f'<!DOCTYPE html><html>{html_head}<body><main class="doc">{mdx_note}{html}</main></body></html>'
-        self.preview.setHtml(html_full)
+            html = _WELCOME_HTML
+        self._last_render_ms = (time.perf_counter() - render_start) * 1000
+        body_html = html  # No copy of the (possibly large) body unless the MDX note is prepended
+        if mdx_changed:  # Only ever True when the text was detected as MDX
+            body_html = _MDX_NOTE_HTML + html
+        if body_html == self._last_html:
+            return
+        self._last_html = body_html
+        if self._preview_ready:
+            self._push_preview(body_html)
+        elif not self._preview_loading:
+            # The scaffold is gone (the page navigated or was reset); reload it
+            self._load_preview_scaffold()
+        # Otherwise _on_preview_ready pushes it once the scaffold has connected
+
+    def _push_preview(self, body_html):
+        """Send only the changed middle of the body; the page splices it into what it has."""
+        old = self._shown_html
+        prefix = _common_prefix_len(old, body_html)
+        suffix = _common_suffix_len(old, body_html, min(len(old), len(body_html)) - prefix)
+        end = len(body_html)
+        middle = body_html[prefix:end - suffix]
+        self._bridge.contentPatched.emit(
+            _utf16_len(body_html, 0, prefix), _utf16_len(body_html, end - suffix, end), middle
+        )
+        self._shown_html = body_html
+
+    def _on_preview_load_started(self):
+        self._preview_ready = False
+        self._preview_loading = True
+
+    def _on_preview_loaded(self, ok):
+        self._preview_loading = False
+
+    def _on_preview_ready(self):
+        # A fresh scaffold holds no content yet
+        self._preview_ready = True
+        self._shown_html = ''
+        if self._last_html is not None:
+            self._push_preview(self._last_html)
+
+    def _load_preview_scaffold(self):
+        """Load the preview page (styles and page script) once; content is patched in later."""
+        self._preview_ready = False
+        self._preview_loading = True
+        self.preview.setContent(
+            _preview_scaffold_bytes(), 'text/html;charset=UTF-8', QUrl(PREVIEW_BASE_URL)
+        )
 
     def new_file(self):
-        self.editor.clear()
+        self._load_generation += 1
+        self._replace_editor_text('')
         self.current_file = None
         self._update_status_bar()
         self._update_window_title()
 
-    def _load_file(self, file_path):
-        """Load a markdown/mdx file into the editor."""
+    def _replace_editor_text(self, text):
+        """Swap in a whole document without a repaint or the debounced textChanged work, then render once."""
+        self.editor.setUpdatesEnabled(False)
+        self.editor.blockSignals(True)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.editor.setPlainText(f.read())
-            self.current_file = file_path
-            self._update_status_bar()
-            self._update_window_title()
-            return True
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
-            return False
+            self.editor.setPlainText(text)
+        finally:
+            self.editor.blockSignals(False)
+            self.editor.setUpdatesEnabled(True)
+        self._preview_timer.stop()
+        self._do_update_preview()
+
+    def _run_io(self, fn, args, on_done, error_message):
+        """Run blocking file work on the I/O thread; on_done(result) runs back on the GUI thread."""
+        task = _IOTask(fn, *args, owner=self)
+        self._io_tasks.add(task)
+        def release():
+            self._io_tasks.discard(task)
+            task.signals.deleteLater()
+        def finished(result):
+            release()
+            on_done(result)
+        def failed(error):
+            release()
+            QMessageBox.critical(self, "Error", f"{error_message}:\n{error}")
+        task.signals.done.connect(finished)
+        task.signals.failed.connect(failed)
+        self._io_pool.start(task)
+
+    def _load_file(self, file_path):
+        """Load a markdown/mdx file into the editor (read off the GUI thread)."""
+        self._load_generation += 1
+        generation = self._load_generation
+        revision = self.editor.document().revision()
+        def loaded(text):
+            if generation != self._load_generation:
+                return  # A later open or New File superseded this read
+            if revision != self.editor.document().revision():
+                # Don't overwrite what was typed while the file was being read
+                self.status_bar.showMessage(f"Open cancelled: the document was edited while {Path(file_path).name} loaded", 4000)
+                return
+            self._set_loaded_file(file_path, text)
+        self._run_io(_read_text, (file_path,), loaded, "Failed to open file")
+
+    def _set_loaded_file(self, file_path, text):
+        # Name the file first: the preview rendered by the text swap treats a .mdx name as MDX
+        self.current_file = file_path
+        self._update_window_title()
+        self._replace_editor_text(text)
+        self._update_status_bar()
 
     def _update_window_title(self):
         """Update window title with current file name."""
@@ -1021,12 +1847,13 @@ class MarkdownEditor(QMainWindow):
 
     def dropEvent(self, event):
         """Handle dropped markdown/mdx files."""
-        for url in event.mimeData().urls():
-            if url.isLocalFile():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.md', '.mdx')):
-                    self._load_file(file_path)
-                    break
+        # Collect every usable path first, then load just one (the first) into the editor
+        paths = [
+            url.toLocalFile() for url in event.mimeData().urls()
+            if url.isLocalFile() and url.toLocalFile().lower().endswith(('.md', '.mdx'))
+        ]
+        if paths:
+            self._load_file(paths[0])
 
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1040,12 +1867,11 @@ class MarkdownEditor(QMainWindow):
 
     def save_file(self):
         if self.current_file:
-            try:
-                with open(self.current_file, 'w', encoding='utf-8') as f:
-                    f.write(self.editor.toPlainText())
-                self.status_bar.showMessage("Saved!", 2000)  # Show for 2 seconds
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save file:\n{e}")
+            self._run_io(
+                _write_text, (self.current_file, self.editor.toPlainText()),
+                lambda _: self.status_bar.showMessage("Saved!", 2000),  # Show for 2 seconds
+                "Failed to save file"
+            )
         else:
             self.save_file_as()
 
@@ -1056,78 +1882,92 @@ class MarkdownEditor(QMainWindow):
             self,
             "Save Markdown/MDX File",
             start_dir,
-            "Markdown Files (*.md);;MDX Files (*.mdx);;All Files (*)"
+            _SAVE_FILTERS
         )
         if file_path:
-            try:
-                file_path = self._coerce_save_extension(file_path, selected_filter)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.editor.toPlainText())
-                self.current_file = file_path
-                self._update_status_bar()
-                self._update_window_title()
-                self.status_bar.showMessage("Saved!", 2000)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save file:\n{e}")
+            file_path = self._coerce_save_extension(file_path, selected_filter)
+            self._run_io(
+                _write_text, (file_path, self.editor.toPlainText()),
+                lambda _: self._set_saved_file(file_path),
+                "Failed to save file"
+            )
+
+    def _set_saved_file(self, file_path):
+        self.current_file = file_path
+        self._update_status_bar()
+        self._update_window_title()
+        self.status_bar.showMessage("Saved!", 2000)
 
     def export_markdown(self):
         file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export as Markdown/MDX",
             str(BASE_DIR),
-            "Markdown Files (*.md);;MDX Files (*.mdx);;All Files (*)"
+            _SAVE_FILTERS
         )
         if file_path:
-            try:
-                file_path = self._coerce_save_extension(file_path, selected_filter)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.editor.toPlainText())
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export Markdown:\n{e}")
+            file_path = self._coerce_save_extension(file_path, selected_filter)
+            self._run_io(_write_text, (file_path, self.editor.toPlainText()), lambda _: None, "Failed to export Markdown")
+
+    def _render_export_html(self, text):
+        """Markdown/MDX source to bare HTML for export; safe to call from a worker thread."""
+        md_text, _ = self._mdx_to_markdown(text)
+        return self.markdown(md_text)
+
+    def _write_export_html(self, file_path, text):
+        _write_text(file_path, self._render_export_html(text))
 
     def export_html(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Export as HTML", str(BASE_DIR), "HTML Files (*.html)")
         if file_path:
-            try:
-                md_text, _ = self._mdx_to_markdown(self.editor.toPlainText())
-                html = self.markdown(md_text)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export HTML:\n{e}")
+            self._run_io(self._write_export_html, (file_path, self.editor.toPlainText()), lambda _: None, "Failed to export HTML")
 
     def export_pdf(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Export as PDF", str(BASE_DIR), "PDF Files (*.pdf)")
         if file_path:
-            try:
-                # QTextDocument for HTML to PDF
-                from PyQt6.QtGui import QTextDocument
-                doc = QTextDocument()
-                md_text, _ = self._mdx_to_markdown(self.editor.toPlainText())
-                html = self.markdown(md_text)
-                doc.setHtml(html)
-                printer = None
+            # Markdown rendering runs on the pool; layout and printing stay on the GUI thread
+            self._run_io(
+                self._render_export_html, (self.editor.toPlainText(),),
+                lambda html: self._print_pdf(file_path, html),
+                "Failed to export PDF"
+            )
+
+    def _print_pdf(self, file_path, html):
+        try:
+            if self._pdf_printer is None:
                 try:
                     from PyQt6.QtPrintSupport import QPrinter
-                    printer = QPrinter()
-                    printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
-                    printer.setOutputFileName(file_path)
-                    doc.print(printer)
                 except ImportError:
                     QMessageBox.critical(self, "Error", "PyQt6.QtPrintSupport is required for PDF export.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export PDF:\n{e}")
+                    return
+                # QTextDocument for HTML to PDF; both are built on the first export and reused
+                from PyQt6.QtGui import QTextDocument
+                self._pdf_doc = QTextDocument(self)
+                self._pdf_printer = QPrinter()
+                self._pdf_printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
+            self._pdf_doc.setHtml(html)
+            self._pdf_printer.setOutputFileName(file_path)
+            self._pdf_doc.print(self._pdf_printer)
+            self._pdf_doc.clear()  # Don't hold on to the exported content between exports
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export PDF:\n{e}")
 
     def export_menu(self):
-        # Show export options (Markdown, HTML, PDF) as a popup menu
-        menu = QMenu(self)
-        menu.addAction('Export as Markdown', self.export_markdown)
-        menu.addAction('Export as HTML', self.export_html)
-        menu.addAction('Export as PDF', self.export_pdf)
-        menu.exec(self.mapToGlobal(self.cursor().pos()))
+        # Show export options (Markdown, HTML, PDF) as a popup menu at the mouse pointer
+        if self._export_menu is None:
+            self._export_menu = QMenu(self)
+            self._export_menu.addAction('Export as Markdown', self.export_markdown)
+            self._export_menu.addAction('Export as HTML', self.export_html)
+            self._export_menu.addAction('Export as PDF', self.export_pdf)
+        self._export_menu.exec(QCursor.pos())
 
     # --- Markdown Palette ---
     def show_markdown_palette(self):
+        if self._md_palette is None:
+            self._md_palette = self._build_markdown_palette()
+        self._open_palette(self._md_palette)
+
+    def _build_markdown_palette(self):
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QLabel
         dialog = QDialog(self)
         dialog.setModal(True)
@@ -1185,34 +2025,7 @@ class MarkdownEditor(QMainWindow):
         search_box = QLineEdit()
         search_box.setPlaceholderText("Type to search Markdown elements...")
         md_list = QListWidget()
-        # Markdown elements: (Display, Syntax)
-        md_elements = [
-            ("Heading 1", "# H1"),
-            ("Heading 2", "## H2"),
-            ("Heading 3", "### H3"),
-            ("Bold", "**bold text**"),
-            ("Italic", "*italicized text*"),
-            ("Blockquote", "> blockquote"),
-            ("Ordered List", "1. First item\n2. Second item\n3. Third item"),
-            ("Unordered List", "- First item\n- Second item\n- Third item"),
-            ("Inline Code", "`code`"),
-            ("Horizontal Rule", "---"),
-            ("Link", "[title](https://www.example.com)"),
-            ("Image", "![alt text](image.jpg)"),
-            ("Table", "| Syntax | Description |\n| ----------- | ----------- |\n| Header | Title |\n| Paragraph | Text |"),
-            ("Fenced Code Block", "```\ncode\n```"),
-            ("Footnote", "Here's a sentence with a footnote. [^1]\n\n[^1]: This is the footnote."),
-            ("Heading ID", "### My Great Heading {#custom-id}"),
-            ("Definition List", "term\n: definition"),
-            ("Strikethrough", "~~The world is flat.~~"),
-            ("Task List", "- [x] Write the press release\n- [ ] Update the website\n- [ ] Contact the media"),
-            ("Emoji", "That is so funny! :joy:"),
-            ("Highlight", "I need to highlight these ==very important words==."),
-            ("Subscript", "H~2~O"),
-            ("Superscript", "X^2^"),
-        ]
-        for label, _ in md_elements:
-            md_list.addItem(label)
+        md_list.addItems(self._MD_LABELS)
         md_list.setCurrentRow(0)
         layout.addWidget(search_box)
         layout.addWidget(md_list)
@@ -1220,169 +2033,117 @@ class MarkdownEditor(QMainWindow):
         layout.addWidget(desc_label)
         dialog.setLayout(layout)
         # --- Filtering ---
+        # Items are created once; filtering only toggles their hidden flag, so rows match _MD_ELEMENTS
+        labels_lc = self._MD_LABELS_LOWER
+        syntax = self._MD_SYNTAX
         def filter_md():
-            text = search_box.text().lower()
-            md_list.clear()
-            for label, _ in md_elements:
-                if text in label.lower():
-                    md_list.addItem(label)
-            if md_list.count() > 0:
-                md_list.setCurrentRow(0)
+            needle = search_box.text().lower()
+            first = -1
+            for row, label_lc in enumerate(labels_lc):
+                hidden = needle not in label_lc
+                md_list.item(row).setHidden(hidden)
+                if first < 0 and not hidden:
+                    first = row
+            md_list.setCurrentRow(first)
         search_box.textChanged.connect(filter_md)
         # --- Keyboard navigation and insert ---
+        def step_md(delta):
+            row = md_list.currentRow() + delta
+            while 0 <= row < md_list.count():
+                if not md_list.item(row).isHidden():
+                    md_list.setCurrentRow(row)
+                    return
+                row += delta
         def handle_md_key(event):
             if event.key() == Qt.Key.Key_Down:
-                row = md_list.currentRow()
-                if row < md_list.count() - 1:
-                    md_list.setCurrentRow(row + 1)
+                step_md(1)
             elif event.key() == Qt.Key.Key_Up:
-                row = md_list.currentRow()
-                if row > 0:
-                    md_list.setCurrentRow(row - 1)
+                step_md(-1)
             elif event.key() in (Qt.Key.Key_Enter, Qt.Key.Key_Return):
                 row = md_list.currentRow()
                 if row >= 0:
-                    label = md_list.item(row).text()
-                    for l, syntax in md_elements:
-                        if l == label:
-                            dialog.accept()
-                            cursor = self.editor.textCursor()
-                            cursor.insertText(syntax)
-                            self.editor.setTextCursor(cursor)
-                            break
+                    dialog.accept()
+                    cursor = self.editor.textCursor()
+                    cursor.insertText(syntax[row])
+                    self.editor.setTextCursor(cursor)
             elif event.key() == Qt.Key.Key_Escape:
                 dialog.reject()
         search_box.keyPressEvent = lambda event: (handle_md_key(event) if handle_md_key(event) is not None else QLineEdit.keyPressEvent(search_box, event))
         md_list.keyPressEvent = lambda event: handle_md_key(event)
         dialog.resize(420, 380)
-        search_box.setFocus()
-        dialog.exec()
+        dialog.search_box = search_box
+        dialog.item_list = md_list
+        return dialog
 
     def show_info_dialog(self):
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTextEdit, QPushButton, QHBoxLayout
-        from PyQt6.QtGui import QPixmap
-        import os
+        if self._info_dialog is None:
+            self._info_dialog = self._build_info_dialog()
+        self._info_dialog.show()
+        self._info_dialog.raise_()
+        self._info_dialog.activateWindow()
+
+    def _build_info_dialog(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Simple-md: Info & Tips")
-        dialog.setModal(True)
-        dialog.setStyleSheet('''
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(18, 21, 28, 0.99),
-                    stop:1 rgba(13, 15, 20, 0.99));
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 20px;
-            }
-            QLabel {
-                color: #e4e8f1;
-                font-size: 14px;
-                background: transparent;
-            }
-            QTextEdit {
-                background: rgba(255, 255, 255, 0.04);
-                color: #a0a8b8;
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 12px;
-                padding: 12px;
-                font-size: 13px;
-                line-height: 1.5;
-            }
-            QPushButton {
-                background: rgba(108, 140, 255, 0.12);
-                color: #e4e8f1;
-                border: 1px solid rgba(108, 140, 255, 0.25);
-                border-radius: 10px;
-                padding: 10px 24px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(108, 140, 255, 0.2);
-                border: 1px solid rgba(108, 140, 255, 0.4);
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background: rgba(108, 140, 255, 0.28);
-            }
-        ''')
+        dialog.setModal(False)
+        dialog.setObjectName("InfoDialog")  # Styled by QDialog#InfoDialog in style.qss
         layout = QVBoxLayout()
         label = QLabel("Welcome to Simple-md! Quick Guide:")
         layout.addWidget(label)
-        info_text = QTextEdit()
-        info_text.setReadOnly(True)
-        info_text.setPlainText(
-            """
-Editor Pane (left):
-- Type Markdown here. Syntax highlighting, auto-pairing, and keyboard shortcuts are supported.
-
-Preview Pane (right):
-- Shows a live preview of your Markdown, including diagrams and math.
-
----
-
-Mermaid Diagrams:
-To render a diagram, use:
-
-```mermaid
-graph TD
-  A --> B
-```
-
----
-
-MathJax/LaTeX:
-- Inline math: $E=mc^2$
-- Block math:
-  $$
-  x = {-b \pm \sqrt{b^2-4ac} \over 2a}
-  $$
-
----
-
-Tips:
-- Use the Palette for commands, MD Palette for Markdown snippets.
-- Auto-pairing for (), [], {}, '', "", and ``.
-- Export to HTML, PDF, and more.
-- Syntax highlighting, smart indent, and more.
-"""
-        )
-        layout.addWidget(info_text)
+        info_text = QLabel(_INFO_GUIDE)
+        info_text.setObjectName("InfoText")
+        info_text.setTextFormat(Qt.TextFormat.PlainText)
+        info_text.setWordWrap(True)
+        info_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        info_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        info_scroll = QScrollArea()
+        info_scroll.setWidgetResizable(True)
+        info_scroll.setWidget(info_text)
+        layout.addWidget(info_scroll)
         # --- Custom Card Footer (Text Only) ---
         layout.addSpacing(16)
-        prod_label = QLabel('<span style="color:#e4e8f1;font-size:16px;font-weight:600;background:transparent;">A product of <span style="color:#7aa2f7;font-weight:600;">Hello.World Consulting</span></span>')
-        prod_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        prod_label.setStyleSheet("background: transparent; margin-bottom: 4px;")
-        layout.addWidget(prod_label)
-        author_label = QLabel('<span style="color:#a0a8b8;font-style:italic;font-size:14px;background:transparent;">Made by Jonathan Reed</span>')
-        author_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        author_label.setStyleSheet("background: transparent; margin-bottom: 4px;")
-        layout.addWidget(author_label)
-        link_label = QLabel('<a href="https://helloworldfirm.com" style="color:#7aa2f7;font-size:14px;font-weight:500;background:transparent;">helloworldfirm.com</a>')
-        link_label.setOpenExternalLinks(True)
-        link_label.setTextInteractionFlags(link_label.textInteractionFlags() | Qt.TextInteractionFlag.TextSelectableByMouse)
-        link_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        link_label.setStyleSheet("background: transparent; margin-bottom: 4px;")
-        layout.addWidget(link_label)
-        copyright_label = QLabel('<span style="color:#6b7280;font-size:12px;background:transparent;">2025 &copy; All Rights Reserved</span>')
-        copyright_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        copyright_label.setStyleSheet("background: transparent; margin-bottom: 8px;")
-        layout.addWidget(copyright_label)
+        footer_label = QLabel(
+            '<span style="color:#e4e8f1;font-size:16px;font-weight:600;">A product of <span style="color:#7aa2f7;">Hello.World Consulting</span></span><br>'
+            '<span style="color:#a0a8b8;font-style:italic;font-size:14px;">Made by Jonathan Reed</span><br>'
+            '<a href="https://helloworldfirm.com" style="color:#7aa2f7;font-size:14px;font-weight:500;">helloworldfirm.com</a><br>'
+            '<span style="color:#6b7280;font-size:12px;">2025 &copy; All Rights Reserved</span>'
+        )
+        footer_label.setOpenExternalLinks(True)
+        footer_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        footer_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        footer_label.setObjectName("InfoFooter")
+        layout.addWidget(footer_label)
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dialog.accept)
         layout.addWidget(close_btn)
         dialog.setLayout(layout)
         dialog.resize(540, 540)
-        dialog.exec()
+        return dialog
+
+@functools.lru_cache(maxsize=None)
+def _stylesheet_text():
+    """QSS theme from resources/, falling back to the repo root copy; read once per process."""
+    for qss_path in (RESOURCES_DIR / "style.qss", BASE_DIR / "style.qss"):
+        qss_file = QFile(str(qss_path))
+        if qss_file.open(QIODevice.OpenModeFlag.ReadOnly):
+            try:
+                return bytes(qss_file.readAll()).decode("utf-8")
+            finally:
+                qss_file.close()
+    return ''
+
+def _apply_stylesheet(app):
+    qss = _stylesheet_text()
+    if qss:
+        app.setStyleSheet(qss)
 
 if __name__ == "__main__":
+    _register_preview_scheme()
+    # Lets QtWebEngine be imported after the QApplication exists (see _setup_ui)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
-    # Apply QSS theme
-    qss_path = RESOURCES_DIR / "style.qss"
-    if not qss_path.exists():
-        qss_path = BASE_DIR / "style.qss"
-    if qss_path.exists():
-        with open(qss_path, "r") as f:
-            app.setStyleSheet(f.read())
     window = MarkdownEditor()
     window.show()
+    # Apply QSS theme once the event loop is running, off the first-show path
+    QTimer.singleShot(0, lambda: _apply_stylesheet(app))
     sys.exit(app.exec())
@@ -0,0 +1,69 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import main  # noqa: E402
+
+# Engines _markdown_renderer tries, and the modules to hide so it falls through to each one
+ENGINES = {
+    'cmarkgfm': (),
+    'mistune': ('cmarkgfm',),
+    'markdown2': ('cmarkgfm', 'mistune'),
+}
+
+def _clear_render_caches():
+    main._markdown_renderer.cache_clear()
+    main._render_md_cached.cache_clear()
+    main._render_export_md.cache_clear()
+    main._render_md_block.cache_clear()
+
+@pytest.fixture(params=list(ENGINES))
+def engine(request, monkeypatch):
+    """Run the test once per installed Markdown engine."""
+    pytest.importorskip(request.param)
+    for name in ENGINES[request.param]:
+        monkeypatch.setitem(sys.modules, name, None)
+    _clear_render_caches()
+    yield request.param
+    _clear_render_caches()
+
+# Why QtWebEngine could not load, or None once it has; set up by qapp
+_webengine_error = None
+
+@pytest.fixture
+def window(qapp):
+    """A MarkdownEditor; needs QtWebEngine, so it is skipped where that cannot load."""
+    if _webengine_error is not None:
+        pytest.skip(f'QtWebEngine unavailable: {_webengine_error}')
+    win = main.MarkdownEditor()
+    yield win
+    win._io_pool.waitForDone()
+    win.deleteLater()
+
+@pytest.fixture(scope='session')
+def qapp():
+    """The QApplication, created in the same order as main's __main__ block."""
+    global _webengine_error
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance()
+    if app is None:
+        # The scheme and QtWebEngine both have to be set up before the application exists
+        try:
+            main._register_preview_scheme()
+            import PyQt6.QtWebEngineWidgets  # noqa: F401
+        except ImportError as e:
+            _webengine_error = e
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+        app = QApplication([])
+    return app
+
+def wait_for_io(win, qapp):
+    """Finish queued file work and deliver its results to the GUI thread."""
+    win._io_pool.waitForDone()
+    qapp.processEvents()
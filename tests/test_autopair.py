@@ -0,0 +1,21 @@
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtTest import QTest
+
+from main import AutoPairTextEdit
+
+def _editor_at_end(text):
+    editor = AutoPairTextEdit()
+    editor.setPlainText(text)
+    editor.moveCursor(QTextCursor.MoveOperation.End)
+    return editor
+
+def test_dollar_pair_after_astral_character(qapp):
+    editor = _editor_at_end('😀 ')
+    QTest.keyClicks(editor, '$$')
+    assert editor.toPlainText() == '😀 $$  $$'
+
+def test_bracket_before_closer_after_astral_character(qapp):
+    editor = _editor_at_end('😀 )')
+    editor.moveCursor(QTextCursor.MoveOperation.Left)
+    QTest.keyClicks(editor, '(')
+    assert editor.toPlainText() == '😀 ()'
@@ -0,0 +1,47 @@
+from conftest import wait_for_io
+
+def test_later_open_wins_over_an_earlier_one(window, qapp, tmp_path):
+    first = tmp_path / 'first.md'
+    second = tmp_path / 'second.md'
+    first.write_text('# First\n', encoding='utf-8')
+    second.write_text('# Second\n', encoding='utf-8')
+    window._load_file(str(first))
+    window._load_file(str(second))
+    wait_for_io(window, qapp)
+    assert window.editor.toPlainText() == '# Second\n'
+    assert window.current_file == str(second)
+
+def test_open_does_not_overwrite_edits_typed_while_loading(window, qapp, tmp_path):
+    path = tmp_path / 'doc.md'
+    path.write_text('# From disk\n', encoding='utf-8')
+    window._load_file(str(path))
+    window.editor.insertPlainText('typed meanwhile')
+    wait_for_io(window, qapp)
+    assert window.editor.toPlainText() == 'typed meanwhile'
+    assert window.current_file is None
+
+def test_preview_links_open_outside_the_preview(window, monkeypatch):
+    from PyQt6.QtCore import QUrl
+    from PyQt6.QtWebEngineCore import QWebEnginePage
+    import main
+    opened = []
+    monkeypatch.setattr(main.QDesktopServices, 'openUrl', opened.append)
+    page = window.preview.page()
+    link = QWebEnginePage.NavigationType.NavigationTypeLinkClicked
+    assert page.acceptNavigationRequest(QUrl(main.PREVIEW_BASE_URL + '#fn1'), link, True)
+    assert not page.acceptNavigationRequest(QUrl('https://example.com/'), link, True)
+    # A relative link resolves under the preview scheme; it must not replace the scaffold
+    assert not page.acceptNavigationRequest(QUrl(main.PREVIEW_BASE_URL + 'other.md'), link, True)
+    typed = QWebEnginePage.NavigationType.NavigationTypeTyped
+    assert not page.acceptNavigationRequest(QUrl(main.PREVIEW_BASE_URL + 'other.md'), typed, True)
+    assert page.acceptNavigationRequest(QUrl(main.PREVIEW_BASE_URL), typed, True)
+    assert opened == [QUrl('https://example.com/')]
+
+def test_first_preview_of_an_mdx_file_converts_it(window, qapp, tmp_path):
+    path = tmp_path / 'a.mdx'
+    path.write_text('# Doc\n\n{/* hidden note */}\n\nText\n', encoding='utf-8')
+    window._load_file(str(path))
+    wait_for_io(window, qapp)
+    assert window.windowTitle() == 'Simple-md - a.mdx'
+    assert '<!-- hidden note -->' in window._last_html
+    assert '{/*' not in window._last_html
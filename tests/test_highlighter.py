@@ -0,0 +1,17 @@
+from PyQt6.QtGui import QTextCursor, QTextDocument
+
+from main import MarkdownHighlighter
+
+def test_insert_above_reuses_ranges_of_moved_lines(qapp):
+    doc = QTextDocument()
+    doc.setPlainText('# Title\nsome **bold** text\n- item `code`\n')
+    highlighter = MarkdownHighlighter(doc)
+    highlighter.rehighlight()
+    misses = highlighter._ranges_for.cache_info().misses
+    cursor = QTextCursor(doc)
+    cursor.insertText('new first line\n')
+    highlighter.rehighlight()
+    # Only the new line is computed; the shifted lines hit the cache
+    assert highlighter._ranges_for.cache_info().misses == misses + 1
+    formats = [(r.start, r.length) for r in doc.findBlockByNumber(2).layout().formats()]
+    assert formats == [(5, 8)]
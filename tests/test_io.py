@@ -0,0 +1,20 @@
+import os
+
+from main import _read_text, _write_text
+
+def test_write_text_uses_platform_newlines(tmp_path):
+    path = tmp_path / 'doc.md'
+    _write_text(path, '# Title\nbody é\n')
+    assert path.read_bytes() == f'# Title{os.linesep}body é{os.linesep}'.encode('utf-8')
+
+def test_read_text_round_trips_written_text(tmp_path):
+    path = tmp_path / 'doc.md'
+    _write_text(path, 'a\nb\n')
+    assert _read_text(path) == 'a\nb\n'
+
+def test_write_text_replaces_longer_file_without_leftovers(tmp_path):
+    path = tmp_path / 'doc.md'
+    path.write_text('a much longer original body\n' * 10, encoding='utf-8')
+    _write_text(path, 'short\n')
+    assert _read_text(path) == 'short\n'
+    assert [p.name for p in tmp_path.iterdir()] == ['doc.md']
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+import main
+from main import _common_prefix_len, _common_suffix_len, _utf16_len
+
+def _reference(a, b):
+    prefix = 0
+    while prefix < min(len(a), len(b)) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(len(a), len(b)) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+@pytest.mark.parametrize('seed', range(20))
+def test_common_ends_match_a_character_scan(monkeypatch, seed):
+    monkeypatch.setattr(main, '_DIFF_CHUNK', 16)  # Exercise chunk boundaries on short strings
+    rng = random.Random(seed)
+    base = ''.join(rng.choice('ab😀é') for _ in range(rng.randint(0, 200)))
+    cut = rng.randint(0, len(base))
+    edited = base[:cut] + ''.join(rng.choice('ab😀') for _ in range(rng.randint(0, 5))) + base[cut + rng.randint(0, 5):]
+    prefix = _common_prefix_len(base, edited)
+    suffix = _common_suffix_len(base, edited, min(len(base), len(edited)) - prefix)
+    assert (prefix, suffix) == _reference(base, edited)
+
+def test_utf16_len_counts_astral_characters_twice():
+    text = 'a😀bé😀c'
+    for start in range(len(text) + 1):
+        for end in range(start, len(text) + 1):
+            assert _utf16_len(text, start, end) == len(text[start:end].encode('utf-16-le')) // 2
+    assert _utf16_len('plain ascii', 2, 7) == 5
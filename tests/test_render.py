@@ -0,0 +1,37 @@
+import pytest
+
+from main import _markdown_to_html, _render_md_block, _render_md_blocks
+
+MERMAID_DOC = 'Intro\n\n```mermaid\ngraph TD\nA-->B\n\nB-->C\n```\n\nAfter\n'
+
+def test_mermaid_fence_with_blank_line_stays_one_code_block(engine):
+    html = _render_md_blocks(MERMAID_DOC)
+    assert 'language-mermaid' in html
+    start = html.index('<pre>')
+    block = html[start:html.index('</pre>', start)]
+    assert 'A--&gt;B' in block and 'B--&gt;C' in block
+    assert '<p>' not in block
+
+# Documents whose constructs reach across blank lines; block rendering must match a whole render
+PARITY_DOCS = [
+    MERMAID_DOC,
+    '\n\nLeading blank lines\n\n# Heading\n',
+    '<span>inline</span> tag\n\n```py\nx = 1\n```\n',
+    '<div>\nhtml\n\nstill html\n</div>\n\nAfter\n',
+    'See [ref]\n\n[ref]: http://example.com\n',
+    'Note[^1]\n\n[^1]: the note\n',
+    '- a\n\n- b\n\n  continued\n\n      indented code in item\n\nAfter\n',
+    '> quote\n- item\n\n```jsx\nx\n```\n',
+    '> quote\n> more\n\n    indented code\n\n> quote\n',
+    'Setext\n======\n\nText  \n\n\n+ plus\n\n10) paren\n',
+    '```\nunclosed\n\n- item\n\n```mermaid\ngraph TD\n```\n',
+    'a | b\n--- | ---\n1 | 2\n\n- [ ] task\n\n***\n\nline\n***\n',
+]
+
+@pytest.mark.parametrize('doc', PARITY_DOCS)
+def test_block_render_matches_whole_render(engine, doc):
+    assert _render_md_blocks(doc) == _markdown_to_html(doc)
+
+def test_plain_document_renders_by_block(engine):
+    _render_md_blocks('# Title\n\nFirst\n\nSecond\n')
+    assert _render_md_block.cache_info().currsize == 3